@@ -265,7 +265,7 @@ async def reset_password(request: ResetPasswordRequest) -> MessageResponse:
             detail="Failed to reset password",
         )
 
-    # Mark token as used
+    # Tokens are single-use
     await user_repo.delete_password_reset_token(request.token)
 
     return MessageResponse(message="Password reset successfully")
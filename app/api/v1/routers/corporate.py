@@ -7,13 +7,14 @@ from typing import Any
 import stripe
 from bson import ObjectId
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 
 from app.core.config import settings
 from app.core.dependencies import get_current_user_id
 from app.core.email_service import send_trainee_invitation_email
 from app.core.security import hash_password
-from app.db import (CorporateRepository, EnrollmentRepository, UserRepository,
-                    get_database)
+from app.db import (CorporateRepository, EnrollmentRepository, UserLoader,
+                    UserRepository, get_database)
 from app.db.course_repository import CourseRepository
 from app.db.schedule_repository import ScheduleRepository
 from app.domain.corporate.models import (AccountStatus, AssignmentStatus,
@@ -42,6 +43,9 @@ stripe.api_key = settings.stripe_secret_key
 
 router = APIRouter(prefix="/corporate", tags=["corporate"])
 
+# Validates a whole page of license documents in one pydantic-core call
+_LICENSE_LIST_ADAPTER = TypeAdapter(list[CorporateLicenseResponse])
+
 
 async def get_current_corporate_user(
     user_id: str = Depends(get_current_user_id),
@@ -405,21 +409,9 @@ async def get_licenses(
     items_doc = await corp_repo.get_licenses(account_id, skip, limit)
     total = await corp_repo.count_licenses(account_id)
 
-    items = [
-        CorporateLicenseResponse(
-            id=str(d["_id"]),
-            course_id=d["course_id"],
-            schedule_id=d["schedule_id"],
-            total_seats=d["total_seats"],
-            assigned_seats=d["assigned_seats"],
-            amount_total=d["amount_total"],
-            currency=d["currency"],
-            status=d["status"],
-            purchased_at=d["purchased_at"],
-            expires_at=d.get("expires_at"),
-        )
-        for d in items_doc
-    ]
+    items = _LICENSE_LIST_ADAPTER.validate_python(
+        [{**d, "id": str(d["_id"]), "expires_at": d.get("expires_at")} for d in items_doc]
+    )
 
     return PaginatedLicenseResponse(total=total, items=items)
 
@@ -572,10 +564,12 @@ async def get_trainees(
     trainee_docs = await corp_repo.get_trainees(account_id, skip, limit)
     total = await corp_repo.count_trainees(account_id)
 
+    # Join with User to get name/email in a single batched lookup, loading only those fields
+    trainee_users = UserLoader(user_repo, projection={"email": 1, "name": 1})
+    user_docs = await trainee_users.load_many(t["user_id"] for t in trainee_docs)
+
     items = []
-    for t_doc in trainee_docs:
-        # Join with User to get name/email
-        u_doc = await user_repo.find_by_id(t_doc["user_id"])
+    for t_doc, u_doc in zip(trainee_docs, user_docs, strict=True):
         if u_doc:
             items.append(
                 CorporateTraineeResponse(
@@ -711,7 +705,8 @@ async def unassign_trainee(
                 {
                     "user_id": ObjectId(trainee_doc["user_id"]),
                     "schedule_id": ObjectId(license_doc["schedule_id"]),
-                }
+                },
+                {"_id": 1},
             )
 
             if existing:
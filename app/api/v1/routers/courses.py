@@ -7,15 +7,13 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer
+from pydantic import TypeAdapter
 
 from app.api.v1.schemas.course_dto import (
     CourseCreateRequest,
-    CourseDetailsDTO,
     CourseResponse,
     CourseUpdateRequest,
     PaginatedCourseResponse,
-    ResourceDTO,
-    SyllabusWeekDTO,
 )
 from app.core.dependencies import require_admin
 from app.db import get_database
@@ -132,7 +130,9 @@ async def get_courses(
     paginated_courses = filtered_courses[skip : skip + limit]
 
     return PaginatedCourseResponse(
-        data=[_course_doc_to_response(course) for course in paginated_courses],
+        data=_COURSE_LIST_ADAPTER.validate_python(
+            [_course_doc_to_dict(course) for course in paginated_courses]
+        ),
         total=len(filtered_courses),
         skip=skip,
         limit=limit,
@@ -341,57 +341,61 @@ async def delete_course(
         )
 
 
+# Validates a whole page of course dicts in one pydantic-core call
+_COURSE_LIST_ADAPTER = TypeAdapter(list[CourseResponse])
+
+
 def _course_doc_to_response(course_doc: dict[str, Any]) -> CourseResponse:
     """Convert a course document from DB to CourseResponse DTO."""
-    # job_role_ids are already strings in the database
-    job_role_ids = course_doc.get("job_role_ids") or []
+    return CourseResponse.model_validate(_course_doc_to_dict(course_doc))
 
-    # Build CourseDetailsDTO
-    course_details_data = course_doc.get("course_details", {})
-    syllabus_weeks = []
-    for w in course_details_data.get("syllabus", []):
-        syllabus_weeks.append(
-            SyllabusWeekDTO(
-                week=w.get("week", "1"), title=w.get("title", ""), topics=w.get("topics", [])
-            )
-        )
 
-    course_details = CourseDetailsDTO(
-        overview=course_details_data.get("overview", ""),
-        objectives=course_details_data.get("objectives", []),
-        prerequisites=course_details_data.get("prerequisites", []),
-        syllabus=syllabus_weeks,
-    )
+def _course_doc_to_dict(course_doc: dict[str, Any]) -> dict[str, Any]:
+    """
+    Shape a course document from DB into the dict CourseResponse validates.
 
-    created_at = course_doc.get("created_at")
-    if not created_at:
-        created_at = datetime.now()
-
-    updated_at = course_doc.get("updated_at")
-    if not updated_at:
-        updated_at = datetime.now()
-
-    return CourseResponse(
-        id=str(course_doc.get("_id", "")),
-        title=course_doc.get("title", "Untitled Course"),
-        description=course_doc.get("description", "No description available"),
-        duration=course_doc.get("duration", "N/A"),
-        level=course_doc.get("level", "BEGINNER"),
-        url=course_doc.get("url"),
-        language=course_doc.get("language"),
-        image=course_doc.get("image"),
-        rating=course_doc.get("rating"),
-        students=course_doc.get("students"),
-        certifications=course_doc.get("certifications") or [],
-        cost=course_doc.get("cost"),
-        category_id=str(course_doc.get("category_id")) if course_doc.get("category_id") else None,
-        vendor_id=str(course_doc.get("vendor_id")) if course_doc.get("vendor_id") else None,
-        job_role_ids=job_role_ids,
-        resources=[ResourceDTO(**r) for r in (course_doc.get("resources") or [])],
-        notice=course_doc.get("notice"),
-        tags=course_doc.get("tags") or [],
-        status=course_doc.get("status", "DRAFT"),
-        course_details=course_details,
-        created_at=created_at,
-        updated_at=updated_at,
-    )
+    Only ObjectId -> str coercion and defaults for missing fields happen here;
+    nested details, syllabus weeks and resources stay plain dicts so the
+    DTOs are built by pydantic-core rather than by Python constructor calls.
+    """
+    # job_role_ids are already strings in the database
+    job_role_ids = course_doc.get("job_role_ids") or []
+
+    course_details_data = course_doc.get("course_details") or {}
+    course_details = {
+        "overview": course_details_data.get("overview", ""),
+        "objectives": course_details_data.get("objectives", []),
+        "prerequisites": course_details_data.get("prerequisites", []),
+        "syllabus": [
+            {"week": w.get("week", "1"), "title": w.get("title", ""), "topics": w.get("topics", [])}
+            for w in course_details_data.get("syllabus", [])
+        ],
+    }
+
+    category_id = course_doc.get("category_id")
+    vendor_id = course_doc.get("vendor_id")
+
+    return {
+        "id": str(course_doc.get("_id", "")),
+        "title": course_doc.get("title", "Untitled Course"),
+        "description": course_doc.get("description", "No description available"),
+        "duration": course_doc.get("duration", "N/A"),
+        "level": course_doc.get("level", "BEGINNER"),
+        "url": course_doc.get("url"),
+        "language": course_doc.get("language"),
+        "image": course_doc.get("image"),
+        "rating": course_doc.get("rating"),
+        "students": course_doc.get("students"),
+        "certifications": course_doc.get("certifications") or [],
+        "cost": course_doc.get("cost"),
+        "category_id": str(category_id) if category_id else None,
+        "vendor_id": str(vendor_id) if vendor_id else None,
+        "job_role_ids": job_role_ids,
+        "resources": course_doc.get("resources") or [],
+        "notice": course_doc.get("notice"),
+        "tags": course_doc.get("tags") or [],
+        "status": course_doc.get("status", "DRAFT"),
+        "course_details": course_details,
+        "created_at": course_doc.get("created_at") or datetime.now(),
+        "updated_at": course_doc.get("updated_at") or datetime.now(),
+    }
@@ -176,7 +176,9 @@ async def _handle_checkout_session_completed(
         return
 
     # Idempotency check: Check if enrollment exists with this checkout session ID
-    existing = await repo.collection.find_one({"stripe_checkout_session_id": session.get("id")})
+    existing = await repo.collection.find_one(
+        {"stripe_checkout_session_id": session.get("id")}, {"_id": 1}
+    )
     if existing:
         print(f"Enrollment already processed for session {session.get('id')}")
         return
@@ -258,7 +260,7 @@ async def _handle_corporate_checkout_completed(session: dict[str, Any]) -> None:
     payment_intent_id = session.get("payment_intent")
     if payment_intent_id:
         existing = await corp_repo.licenses.find_one(
-            {"stripe_payment_intent_id": payment_intent_id}
+            {"stripe_payment_intent_id": payment_intent_id}, {"_id": 1}
         )
         if existing:
             print(f"[WEBHOOK] Corporate license already processed for payment {payment_intent_id}")
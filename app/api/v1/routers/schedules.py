@@ -34,6 +34,11 @@ async def get_schedule_repository() -> ScheduleRepository:
     return ScheduleRepository(get_database())
 
 
+def _schedule_response(schedule_doc: dict[str, Any]) -> ScheduleResponse:
+    """Validate a stored schedule and read the response from its attributes."""
+    return ScheduleResponse.model_validate(Schedule.from_mongo(schedule_doc), from_attributes=True)
+
+
 @router.post(
     "/",
     response_model=ScheduleResponse,
@@ -58,7 +63,7 @@ async def create_schedule(
         meeting_url=request.meeting_url,
         timezone=request.timezone,
     )
-    return ScheduleResponse.model_validate(Schedule.from_mongo(schedule_doc).model_dump())
+    return _schedule_response(schedule_doc)
 
 
 @router.get(
@@ -79,8 +84,8 @@ async def get_upcoming_schedules(
     """
     docs = await repo.get_upcoming_schedules(course_id=course_id, tutor_id=tutor_id)
 
-    # helper to map doc to PublicScheduleResponse
-    # helper to map doc to PublicScheduleResponse
+    # Domain sessions share SessionDTO's fields, so the DTOs are validated from
+    # their attributes without a model_dump round trip
     results = []
     for doc in docs:
         schedule = Schedule.from_mongo(doc)
@@ -88,7 +93,9 @@ async def get_upcoming_schedules(
             PublicScheduleResponse(
                 id=schedule.id,
                 course_id=schedule.course_id,
-                sessions=[SessionDTO.model_validate(s.model_dump()) for s in schedule.sessions],
+                sessions=[
+                    SessionDTO.model_validate(s, from_attributes=True) for s in schedule.sessions
+                ],
                 capacity=schedule.capacity,
                 timezone=schedule.timezone,
             )
@@ -113,7 +120,7 @@ async def get_my_schedules(
     **Tutor only** - Returns all schedules where the tutor is assigned.
     """
     docs = await repo.get_schedules_by_tutor(current_user_id)
-    return [ScheduleResponse.model_validate(Schedule.from_mongo(doc).model_dump()) for doc in docs]
+    return [_schedule_response(doc) for doc in docs]
 
 
 @router.get(
@@ -129,7 +136,7 @@ async def get_schedule(
     schedule_doc = await repo.find_by_id(schedule_id)
     if not schedule_doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schedule not found")
-    return ScheduleResponse.model_validate(Schedule.from_mongo(schedule_doc).model_dump())
+    return _schedule_response(schedule_doc)
 
 
 @router.get(
@@ -149,10 +156,10 @@ async def get_schedules(
     elif tutor_id:
         docs = await repo.get_schedules_by_tutor(tutor_id)
     else:
-        # Return all schedules if no filter provided
-        docs = await repo.get_all_schedules()
+        # Return all schedules if no filter provided, streamed from the cursor
+        return [_schedule_response(doc) async for doc in repo.iter_all_schedules()]
 
-    return [ScheduleResponse.model_validate(Schedule.from_mongo(doc).model_dump()) for doc in docs]
+    return [_schedule_response(doc) for doc in docs]
 
 
 @router.put(
@@ -182,7 +189,7 @@ async def update_schedule(
     )
     if not updated_doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Schedule not found")
-    return ScheduleResponse.model_validate(Schedule.from_mongo(updated_doc).model_dump())
+    return _schedule_response(updated_doc)
 
 
 @router.delete(
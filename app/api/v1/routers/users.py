@@ -39,10 +39,7 @@ async def list_tutors(
     db = get_database()
     user_repo = UserRepository(db)
 
-    # Get all users with tutor role
-    tutor_docs = await user_repo.find_users_by_role(UserRole.TUTOR)
-
-    # Convert to response models
+    # Stream users with tutor role straight into response models
     tutors = [
         TutorResponse(
             user_id=str(doc["_id"]),
@@ -50,7 +47,7 @@ async def list_tutors(
             name=doc["name"],
             role=UserRole.TUTOR,
         )
-        for doc in tutor_docs
+        async for doc in user_repo.iter_users({"role": UserRole.TUTOR.value})
     ]
 
     return tutors
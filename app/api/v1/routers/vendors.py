@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.security import HTTPBearer
 
 from app.api.v1.schemas.vendor_dto import (
@@ -19,19 +19,26 @@ security = HTTPBearer(auto_error=False)
 
 
 @router.get("", response_model=list[VendorResponse])
-async def get_all_vendors() -> list[VendorResponse]:
+async def get_all_vendors(
+    limit: int | None = Query(None, ge=1, le=100, description="Page size (all vendors if omitted)"),
+    after_id: str | None = Query(None, description="Return vendors after this ID (pagination)"),
+) -> list[VendorResponse]:
     """
     Get all vendors.
 
     No authentication required - anyone can read vendors.
 
+    Args:
+        limit: Optional page size
+        after_id: ID of the last vendor on the previous page
+
     Returns:
-        List of all vendors.
+        List of vendors, ordered by ID.
     """
     db = get_database()
     repo = VendorRepository(db)
 
-    vendors = await repo.get_all_vendors()
+    vendors = await repo.get_all_vendors(limit=limit, after_id=after_id)
 
     return [
         VendorResponse(
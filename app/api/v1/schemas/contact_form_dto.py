@@ -5,10 +5,10 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
 
-from app.domain.contact_forms.value_objects import ContactFormStatus
+from app.domain.contact_forms.value_objects import ContactEmail, ContactFormStatus
 
 
 class ContactFormHistoryEntry(BaseModel):
@@ -26,7 +26,7 @@ class ContactFormRequest(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
     name: str = Field(min_length=1, max_length=200, description="Submitter's name")
-    email: EmailStr = Field(description="Submitter's email")
+    email: ContactEmail = Field(description="Submitter's email")
     subject: str = Field(min_length=1, max_length=500, description="Contact form subject")
     message: str = Field(min_length=1, max_length=5000, description="Contact form message")
 
@@ -38,7 +38,8 @@ class ContactFormResponse(BaseModel):
 
     id: str = Field(description="Contact form ID")
     name: str = Field(description="Submitter's name")
-    email: EmailStr = Field(description="Submitter's email")
+    # Stored emails were validated on submission
+    email: str = Field(description="Submitter's email")
     subject: str = Field(description="Contact form subject")
     message: str = Field(description="Contact form message")
     status: ContactFormStatus = Field(description="Current status of the form")
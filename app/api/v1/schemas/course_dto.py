@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field
 
 
 class SyllabusWeekDTO(BaseModel):
@@ -12,15 +12,7 @@ class SyllabusWeekDTO(BaseModel):
 
     week: str = Field(min_length=1, max_length=100, description="Week identifier")
     title: str = Field(min_length=1, max_length=200, description="Week title")
-    topics: list[str] = Field(description="Topics covered in this week")
-
-    @field_validator("topics")
-    @classmethod
-    def validate_topics(cls, v: list[str]) -> list[str]:
-        """Validate topics list."""
-        if len(v) > 50:
-            raise ValueError("Topics must have 0-50 items")
-        return v
+    topics: list[str] = Field(max_length=50, description="Topics covered in this week")
 
 
 class CourseDetailsDTO(BaseModel):
@@ -29,41 +21,20 @@ class CourseDetailsDTO(BaseModel):
     overview: str = Field(default="", max_length=10000, description="Course overview")
     objectives: list[str] = Field(
         default_factory=list,
+        max_length=20,
         description="Learning objectives (optional)",
     )
     prerequisites: list[str] = Field(
         default_factory=list,
+        max_length=20,
         description="Course prerequisites (optional)",
     )
     syllabus: list[SyllabusWeekDTO] = Field(
         default_factory=list,
+        max_length=52,
         description="Course syllabus by week (optional)",
     )
 
-    @field_validator("objectives")
-    @classmethod
-    def validate_objectives(cls, v: list[str]) -> list[str]:
-        """Validate objectives list."""
-        if len(v) > 20:
-            raise ValueError("Objectives must have 0-20 items")
-        return v
-
-    @field_validator("prerequisites")
-    @classmethod
-    def validate_prerequisites(cls, v: list[str]) -> list[str]:
-        """Validate prerequisites list."""
-        if len(v) > 20:
-            raise ValueError("Prerequisites must have 0-20 items")
-        return v
-
-    @field_validator("syllabus")
-    @classmethod
-    def validate_syllabus(cls, v: list[SyllabusWeekDTO]) -> list[SyllabusWeekDTO]:
-        """Validate syllabus list."""
-        if len(v) > 52:
-            raise ValueError("Syllabus must have 0-52 weeks")
-        return v
-
 
 class ResourceDTO(BaseModel):
     """DTO for course resource."""
@@ -89,6 +60,7 @@ class CourseCreateRequest(BaseModel):
     students: int | None = Field(None, ge=0, description="Number of students")
     certifications: list[str] = Field(
         default_factory=list,
+        max_length=10,
         description="Associated certifications",
     )
     cost: float | None = Field(None, ge=0, description="Course cost/price")
@@ -100,14 +72,6 @@ class CourseCreateRequest(BaseModel):
     tags: list[str] | None = Field(None, description="Search tags")
     status: str | None = Field(None, description="Course status (DRAFT, PUBLISHED, ARCHIVED)")
 
-    @field_validator("certifications")
-    @classmethod
-    def validate_certifications(cls, v: list[str]) -> list[str]:
-        """Validate certifications list."""
-        if len(v) > 10:
-            raise ValueError("Certifications must have 0-10 items")
-        return v
-
 
 class CourseUpdateRequest(BaseModel):
     """Request DTO for updating a course."""
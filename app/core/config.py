@@ -16,11 +16,23 @@ class Settings(BaseSettings):
     jwt_algorithm: str = "HS256"
     jwt_expiration_hours: int = 24
 
+    # Argon2 password hashing cost; only lower these for tests and local seeding
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # KiB
+
     # MongoDB settings
     mongodb_url: str = "mongodb://localhost:27017"
     mongodb_db: str = "appdb"
     mongodb_username: str | None = None
     mongodb_password: str | None = None
+    mongodb_max_pool_size: int = 50
+    mongodb_min_pool_size: int = 10  # Kept open in the background so spikes skip the handshake
+    mongodb_max_idle_time_ms: int = 300_000
+    # Per-process cache of user lookups, including the role, is_active and
+    # hashed_password fields auth relies on. Writes only invalidate the worker
+    # that made them, so enable it only with a single worker. 0 disables it.
+    user_cache_ttl_seconds: float = 0
+    vendor_cache_ttl_seconds: float = 30  # 0 disables the vendor lookup cache
 
     # Mailtrap settings
     mailtrap_api_token: str = ""
@@ -36,6 +48,10 @@ class Settings(BaseSettings):
     # App settings
     debug: bool = False
     frontend_url: str = "http://localhost:3000"
+    # Origins allowed by credentialed CORS, matched against the full Origin header.
+    # Only the https frontends by default; widen it through CORS_ORIGIN_REGEX in
+    # development (e.g. for local dev servers). Empty disables CORS.
+    cors_origin_regex: str = r"^https://(www\.)?(cencad\.ca|cencad-dev\.netlify\.app)$"
 
 
 settings = Settings()
@@ -5,6 +5,7 @@ from app.db.corporate_repository import CorporateRepository
 from app.db.course_category_repository import CourseCategoryRepository
 from app.db.enrollment_repository import EnrollmentRepository
 from app.db.job_role_repository import JobRoleRepository
+from app.db.loaders import UserLoader
 from app.db.mongo import close_mongodb_connection, connect_to_mongodb, get_database
 from app.db.repository import UserRepository
 
@@ -13,6 +14,7 @@ __all__ = [
     "close_mongodb_connection",
     "get_database",
     "UserRepository",
+    "UserLoader",
     "CourseCategoryRepository",
     "JobRoleRepository",
     "ContactFormRepository",
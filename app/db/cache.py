@@ -0,0 +1,74 @@
+"""Small in-process caches for hot repository lookups."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from typing import Any
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a fixed number of seconds.
+
+    Only touched from the event loop thread, so no locking is needed. A TTL
+    of zero disables caching entirely. Entries may carry a tag (e.g. the
+    document ID) so every key caching the same document can be dropped
+    together without scanning the cache.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        """Initialize with the maximum number of entries and their lifetime."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Any, Hashable | None]] = OrderedDict()
+        self._keys_by_tag: dict[Hashable, set[Hashable]] = {}
+
+    def get(self, key: Hashable) -> Any | None:
+        """Return the cached value for key, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value, _ = entry
+        if expires_at <= time.monotonic():
+            self._delete(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any, *, tag: Hashable | None = None) -> None:
+        """Store value under key, evicting the least recently used entry if full."""
+        if self.ttl <= 0:
+            return
+
+        self._delete(key)
+        self._entries[key] = (time.monotonic() + self.ttl, value, tag)
+        if tag is not None:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        if len(self._entries) > self.maxsize:
+            self._delete(next(iter(self._entries)))
+
+    def invalidate_tag(self, tag: Hashable) -> None:
+        """Drop every entry stored with tag."""
+        for key in self._keys_by_tag.pop(tag, ()):
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+        self._keys_by_tag.clear()
+
+    def _delete(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None or entry[2] is None:
+            return
+
+        tag = entry[2]
+        tagged_keys = self._keys_by_tag.get(tag)
+        if tagged_keys is not None:
+            tagged_keys.discard(key)
+            if not tagged_keys:
+                del self._keys_by_tag[tag]
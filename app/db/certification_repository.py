@@ -5,7 +5,8 @@ from __future__ import annotations
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.db.vendor_repository import VendorRepository
 
@@ -13,9 +14,9 @@ from app.db.vendor_repository import VendorRepository
 class CertificationRepository:
     """Repository for Certification aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["certifications"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["certifications"]
         self.vendor_repo = VendorRepository(db)
 
     async def create_certification(
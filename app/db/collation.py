@@ -0,0 +1,61 @@
+"""Case-insensitive collation and the unique name index built with it."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.collation import Collation
+from pymongo.errors import DuplicateKeyError
+
+# Case-insensitive matching; queries must pass it to use an index built with it
+CASE_INSENSITIVE = Collation(locale="en", strength=2)
+
+NAME_INDEX_NAME = "name_ci"
+
+# Binary name indexes superseded by NAME_INDEX_NAME and its (name, _id) companion
+_LEGACY_NAME_INDEXES = ("name_1", "name_1__id_1")
+
+
+async def ensure_case_insensitive_unique_name(collection: AsyncCollection[Any]) -> None:
+    """
+    Make names unique regardless of case, replacing the old binary name indexes.
+
+    Builds the unique name_ci index and a (name, _id) index that covers rename
+    duplicate checks, then drops the legacy name_1/name_1__id_1 indexes.
+
+    Args:
+        collection: Collection whose documents have a name field
+
+    Raises:
+        RuntimeError: If stored names differ only by case; the legacy indexes
+            stay in place until those names are changed
+    """
+    try:
+        await collection.create_index(
+            "name", unique=True, collation=CASE_INSENSITIVE, name=NAME_INDEX_NAME
+        )
+    except DuplicateKeyError as e:
+        raise RuntimeError(
+            f"Cannot build {NAME_INDEX_NAME} on {collection.name}, names differ only by case: "
+            f"{await _case_variant_names(collection)}"
+        ) from e
+    await collection.create_index(
+        [("name", 1), ("_id", 1)], collation=CASE_INSENSITIVE, name=f"{NAME_INDEX_NAME}_id"
+    )
+
+    existing = await collection.index_information()
+    for legacy in _LEGACY_NAME_INDEXES:
+        if legacy in existing:
+            await collection.drop_index(legacy)
+
+
+async def _case_variant_names(collection: AsyncCollection[Any]) -> list[list[str]]:
+    """Group stored names that collide under CASE_INSENSITIVE."""
+    cursor = await collection.aggregate(
+        [
+            {"$group": {"_id": {"$toLower": "$name"}, "names": {"$push": "$name"}}},
+            {"$match": {"names.1": {"$exists": True}}},
+        ]
+    )
+    return [group["names"] async for group in cursor]
@@ -6,7 +6,8 @@ from datetime import UTC
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.domain.contact_forms.value_objects import ContactFormStatus
 
@@ -14,9 +15,9 @@ from app.domain.contact_forms.value_objects import ContactFormStatus
 class ContactFormRepository:
     """Repository for ContactForm aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["contact-forms"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["contact-forms"]
 
     async def create(
         self,
@@ -4,7 +4,8 @@ from collections.abc import Mapping, Sequence
 from typing import Any, cast
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.domain.corporate.models import (
     CorporateAccount,
@@ -17,11 +18,11 @@ from app.domain.corporate.models import (
 class CorporateRepository:
     """Repository for Corporate domain aggregates using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
-        self.accounts: AsyncIOMotorCollection[dict[str, Any]] = db["corporate_accounts"]
-        self.licenses: AsyncIOMotorCollection[dict[str, Any]] = db["corporate_licenses"]
-        self.trainees: AsyncIOMotorCollection[dict[str, Any]] = db["corporate_trainees"]
-        self.assignments: AsyncIOMotorCollection[dict[str, Any]] = db["corporate_assignments"]
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
+        self.accounts: AsyncCollection[dict[str, Any]] = db["corporate_accounts"]
+        self.licenses: AsyncCollection[dict[str, Any]] = db["corporate_licenses"]
+        self.trainees: AsyncCollection[dict[str, Any]] = db["corporate_trainees"]
+        self.assignments: AsyncCollection[dict[str, Any]] = db["corporate_assignments"]
 
     # --- Corporate Account ---
 
@@ -193,9 +194,8 @@ class CorporateRepository:
                 }
             },
         ]
-        license_stats = await self.licenses.aggregate(
-            cast(Sequence[Mapping[str, Any]], pipeline)
-        ).to_list(length=1)
+        license_cursor = await self.licenses.aggregate(cast(Sequence[Mapping[str, Any]], pipeline))
+        license_stats = await license_cursor.to_list(length=1)
 
         trainee_count = await self.count_trainees(account_id)
         # Assuming all current trainees in list are active for simplicity,
@@ -5,13 +5,16 @@ from __future__ import annotations
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import DuplicateKeyError
+
+from app.db.collation import CASE_INSENSITIVE, ensure_case_insensitive_unique_name
 
 
 class CourseCategoryRepository:
     """Repository for CourseCategory aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
         self.collection = db["course_categories"]
 
@@ -34,7 +37,9 @@ class CourseCategoryRepository:
             ValueError: If category with same name already exists
         """
         # Check if category with same name already exists
-        existing = await self.collection.find_one({"name": name})
+        existing = await self.collection.find_one(
+            {"name": name}, {"_id": 1}, collation=CASE_INSENSITIVE
+        )
         if existing:
             raise ValueError(f"Category with name '{name}' already exists")
 
@@ -45,7 +50,11 @@ class CourseCategoryRepository:
             "updated_at": ObjectId().generation_time,
         }
 
-        result = await self.collection.insert_one(category_doc)
+        # The unique name_ci index rejects an insert that races the check above
+        try:
+            result = await self.collection.insert_one(category_doc)
+        except DuplicateKeyError as e:
+            raise ValueError(f"Category with name '{name}' already exists") from e
         category_doc["_id"] = result.inserted_id
 
         return category_doc
@@ -103,7 +112,9 @@ class CourseCategoryRepository:
             if name is not None:
                 # Check if new name already exists
                 existing = await self.collection.find_one(
-                    {"name": name, "_id": {"$ne": ObjectId(category_id)}}
+                    {"name": name, "_id": {"$ne": ObjectId(category_id)}},
+                    {"_id": 1},
+                    collation=CASE_INSENSITIVE,
                 )
                 if existing:
                     raise ValueError(f"Category with name '{name}' already exists")
@@ -124,6 +135,9 @@ class CourseCategoryRepository:
                 return_document=True,
             )
             return result  # type: ignore[no-any-return]
+        except DuplicateKeyError as e:
+            # The unique name_ci index rejects a rename that races the check above
+            raise ValueError(f"Category with name '{name}' already exists") from e
         except ValueError:
             raise
         except Exception:
@@ -147,5 +161,5 @@ class CourseCategoryRepository:
 
     async def create_indexes(self) -> None:
         """Create necessary database indexes for performance."""
-        # Create unique index on name for fast lookups and uniqueness
-        await self.collection.create_index("name", unique=True)
+        # Case-insensitive unique index on name; supersedes the old binary name_1 index
+        await ensure_case_insensitive_unique_name(self.collection)
@@ -5,15 +5,16 @@ from __future__ import annotations
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
 
 class CourseRepository:
     """Repository for Course aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["courses"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["courses"]
 
     async def create_course(
         self,
@@ -68,7 +69,7 @@ class CourseRepository:
             ValueError: If course with same title already exists
         """
         # Check if course with same title already exists
-        existing = await self.collection.find_one({"title": title})
+        existing = await self.collection.find_one({"title": title}, {"_id": 1})
         if existing:
             raise ValueError(f"Course with title '{title}' already exists")
 
@@ -259,7 +260,7 @@ class CourseRepository:
             if title is not None:
                 # Check if new title already exists
                 existing = await self.collection.find_one(
-                    {"title": title, "_id": {"$ne": ObjectId(course_id)}}
+                    {"title": title, "_id": {"$ne": ObjectId(course_id)}}, {"_id": 1}
                 )
                 if existing:
                     raise ValueError(f"Course with title '{title}' already exists")
@@ -356,12 +357,16 @@ class CourseRepository:
         """Create necessary database indexes for performance."""
         # Create unique index on title
         await self.collection.create_index("title", unique=True)
+        # Covers the rename duplicate check (title match, _id $ne, _id-only projection)
+        await self.collection.create_index([("title", 1), ("_id", 1)])
         # Index on level for filtering
         await self.collection.create_index("level")
         # Index on category_id for joins
         await self.collection.create_index("category_id")
         # Index on vendor_id for joins
         await self.collection.create_index("vendor_id")
+        # Vendor + category listings share the vendor_id prefix
+        await self.collection.create_index([("vendor_id", 1), ("category_id", 1)])
         # Index on job_role_ids for many-to-many queries
         await self.collection.create_index("job_role_ids")
         # Index on tags for search
@@ -2,18 +2,20 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
 
 
 class EnrollmentRepository:
     """Repository for Enrollment aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["enrollments"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["enrollments"]
 
     async def create_enrollment(
         self,
@@ -28,8 +30,7 @@ class EnrollmentRepository:
         **kwargs: Any,
     ) -> dict[str, Any]:
         """Create a new enrollment."""
-        from datetime import datetime
-
+        now = datetime.now(UTC)
         enrollment_doc: dict[str, Any] = {
             "user_id": ObjectId(user_id),
             "schedule_id": ObjectId(schedule_id),
@@ -40,8 +41,8 @@ class EnrollmentRepository:
             "currency": currency,
             "stripe_payment_intent_id": stripe_payment_intent_id,
             "stripe_checkout_session_id": stripe_checkout_session_id,
-            "created_at": datetime.utcnow(),
-            "enrolled_at": datetime.utcnow(),  # For backward compat or business logic
+            "created_at": now,
+            "enrolled_at": now,  # For backward compat or business logic
             "instructor_notes": [],
         }
 
@@ -127,3 +128,8 @@ class EnrollmentRepository:
         await self.collection.create_index("course_id")
         # Compound index for unique enrollment per student per schedule
         await self.collection.create_index([("user_id", 1), ("schedule_id", 1)], unique=True)
+        # Equality-first compound indexes for per-student and per-schedule status filters
+        await self.collection.create_index([("user_id", 1), ("status", 1)])
+        await self.collection.create_index([("schedule_id", 1), ("payment_status", 1)])
+        # Stripe webhook idempotency lookup; only paid checkouts carry a session ID
+        await self.collection.create_index("stripe_checkout_session_id", sparse=True)
@@ -0,0 +1,21 @@
+"""ObjectId parsing helpers shared by repositories."""
+
+from __future__ import annotations
+
+from functools import lru_cache
+
+from bson import ObjectId
+
+
+@lru_cache(maxsize=4096)
+def parse_object_id(value: str) -> ObjectId:
+    """
+    Parse a hex string into an ObjectId, caching recent conversions.
+
+    ObjectId instances are immutable, so the same object can safely be
+    shared across queries for hot IDs (e.g. the authenticated user).
+
+    Raises:
+        InvalidId: If value is not a valid 24-character hex ObjectId
+    """
+    return ObjectId(value)
@@ -0,0 +1,71 @@
+"""Startup hook that ensures every repository's indexes exist."""
+
+from __future__ import annotations
+
+import logging
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.db.contact_form_repository import ContactFormRepository
+from app.db.corporate_repository import CorporateRepository
+from app.db.course_category_repository import CourseCategoryRepository
+from app.db.course_repository import CourseRepository
+from app.db.enrollment_repository import EnrollmentRepository
+from app.db.job_role_repository import JobRoleRepository
+from app.db.repository import UserRepository
+from app.db.schedule_repository import ScheduleRepository
+from app.db.vendor_repository import VendorRepository
+
+logger = logging.getLogger(__name__)
+
+# Index sets already ensured by this process, keyed by database and name
+_ENSURED: set[tuple[str, str]] = set()
+
+
+async def ensure_indexes(db: AsyncDatabase[Any]) -> None:
+    """
+    Create all repository indexes once per process.
+
+    create_index is idempotent on the server but still costs a round trip
+    per index, so repeat calls (e.g. a second app instance in the same
+    process) return without touching the database. Every index set is
+    attempted; failures are logged and then abort startup, since the
+    repositories rely on the unique indexes to reject duplicates.
+
+    Args:
+        db: Database to create the indexes in
+
+    Raises:
+        RuntimeError: If any index set could not be created
+    """
+    users = UserRepository(db)
+    index_sets: dict[str, Callable[[], Awaitable[None]]] = {
+        "users": users.create_indexes,
+        "password_reset_tokens": users.create_password_reset_indexes,
+        "vendors": VendorRepository(db).create_indexes,
+        "course_categories": CourseCategoryRepository(db).create_indexes,
+        "job_roles": JobRoleRepository(db).create_indexes,
+        "courses": CourseRepository(db).create_indexes,
+        "schedules": ScheduleRepository(db).create_indexes,
+        "enrollments": EnrollmentRepository(db).create_indexes,
+        "contact_forms": ContactFormRepository(db).create_indexes,
+        "corporate": CorporateRepository(db).create_indexes,
+    }
+
+    failed: list[str] = []
+    for name, create in index_sets.items():
+        key = (db.name, name)
+        if key in _ENSURED:
+            continue
+        try:
+            await create()
+        except Exception:
+            logger.exception("Failed to ensure %s indexes", name)
+            failed.append(name)
+            continue
+        _ENSURED.add(key)
+
+    if failed:
+        raise RuntimeError(f"Failed to ensure indexes for: {', '.join(failed)}")
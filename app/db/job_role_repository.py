@@ -5,15 +5,19 @@ from __future__ import annotations
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import DuplicateKeyError
+
+from app.db.collation import CASE_INSENSITIVE, ensure_case_insensitive_unique_name
 
 
 class JobRoleRepository:
     """Repository for JobRole aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["job_roles"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["job_roles"]
 
     async def create_job_role(
         self,
@@ -34,7 +38,9 @@ class JobRoleRepository:
             ValueError: If job role with same name already exists
         """
         # Check if job role with same name already exists
-        existing = await self.collection.find_one({"name": name})
+        existing = await self.collection.find_one(
+            {"name": name}, {"_id": 1}, collation=CASE_INSENSITIVE
+        )
         if existing:
             raise ValueError(f"Job role with name '{name}' already exists")
 
@@ -45,7 +51,11 @@ class JobRoleRepository:
             "updated_at": ObjectId().generation_time,
         }
 
-        result = await self.collection.insert_one(job_role_doc)
+        # The unique name_ci index rejects an insert that races the check above
+        try:
+            result = await self.collection.insert_one(job_role_doc)
+        except DuplicateKeyError as e:
+            raise ValueError(f"Job role with name '{name}' already exists") from e
         job_role_doc["_id"] = result.inserted_id
 
         return job_role_doc
@@ -75,7 +85,7 @@ class JobRoleRepository:
         Returns:
             Job role document if found, None otherwise
         """
-        return await self.collection.find_one({"name": name})
+        return await self.collection.find_one({"name": name}, collation=CASE_INSENSITIVE)
 
     async def get_all_job_roles(self) -> list[dict[str, Any]]:
         """Get all job roles from database."""
@@ -103,7 +113,9 @@ class JobRoleRepository:
             if name is not None:
                 # Check if new name already exists
                 existing = await self.collection.find_one(
-                    {"name": name, "_id": {"$ne": ObjectId(job_role_id)}}
+                    {"name": name, "_id": {"$ne": ObjectId(job_role_id)}},
+                    {"_id": 1},
+                    collation=CASE_INSENSITIVE,
                 )
                 if existing:
                     raise ValueError(f"Job role with name '{name}' already exists")
@@ -124,6 +136,9 @@ class JobRoleRepository:
                 return_document=True,
             )
             return result
+        except DuplicateKeyError as e:
+            # The unique name_ci index rejects a rename that races the check above
+            raise ValueError(f"Job role with name '{name}' already exists") from e
         except ValueError:
             raise
         except Exception:
@@ -147,5 +162,5 @@ class JobRoleRepository:
 
     async def create_indexes(self) -> None:
         """Create necessary database indexes for performance."""
-        # Create unique index on name for fast lookups and uniqueness
-        await self.collection.create_index("name", unique=True)
+        # Case-insensitive unique index on name; supersedes the old binary name_1 index
+        await ensure_case_insensitive_unique_name(self.collection)
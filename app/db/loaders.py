@@ -0,0 +1,96 @@
+"""Request-scoped loaders that batch find_by_id lookups into a single $in query."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from functools import partial
+from typing import Any
+
+from bson import ObjectId
+from bson.errors import InvalidId
+
+from app.db.ids import parse_object_id
+from app.db.repository import USER_LIST_PROJECTION, UserRepository
+
+BatchFetch = Callable[[list[ObjectId]], Awaitable[list[dict[str, Any]]]]
+
+
+class DocumentLoader:
+    """
+    Batch concurrent lookups by ID into one query.
+
+    Every ``load`` issued within the same event-loop tick (e.g. from an
+    ``asyncio.gather``) is collected and resolved by a single fetch call.
+    Create one loader per request; results are not cached across batches.
+    """
+
+    def __init__(self, fetch: BatchFetch) -> None:
+        """Initialize with a coroutine that fetches documents for a list of ObjectIds."""
+        self._fetch = fetch
+        self._pending: dict[ObjectId, list[asyncio.Future[dict[str, Any] | None]]] = {}
+        self._dispatches: set[asyncio.Task[None]] = set()
+
+    async def load(self, doc_id: str) -> dict[str, Any] | None:
+        """
+        Load a document by ID.
+
+        Args:
+            doc_id: MongoDB ObjectId as string
+
+        Returns:
+            Document if found, None otherwise (including for malformed IDs)
+        """
+        try:
+            oid = parse_object_id(doc_id)
+        except (InvalidId, TypeError):
+            return None
+
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            loop.call_soon(self._flush)
+
+        future: asyncio.Future[dict[str, Any] | None] = loop.create_future()
+        self._pending.setdefault(oid, []).append(future)
+        return await future
+
+    async def load_many(self, doc_ids: Iterable[str]) -> list[dict[str, Any] | None]:
+        """Load several documents, preserving input order."""
+        return list(await asyncio.gather(*(self.load(doc_id) for doc_id in doc_ids)))
+
+    def _flush(self) -> None:
+        pending, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._dispatch(pending))
+        self._dispatches.add(task)
+        task.add_done_callback(self._dispatches.discard)
+
+    async def _dispatch(
+        self, pending: dict[ObjectId, list[asyncio.Future[dict[str, Any] | None]]]
+    ) -> None:
+        try:
+            docs = await self._fetch(list(pending))
+        except Exception as exc:
+            # Surface the failure once per batch to every waiter
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(exc)
+            return
+
+        docs_by_id = {doc["_id"]: doc for doc in docs}
+        for oid, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    future.set_result(docs_by_id.get(oid))
+
+
+class UserLoader(DocumentLoader):
+    """Batching loader for user documents."""
+
+    def __init__(
+        self,
+        repo: UserRepository,
+        projection: Mapping[str, Any] | None = USER_LIST_PROJECTION,
+    ) -> None:
+        """Initialize with a user repository and the fields to load for each user."""
+        super().__init__(partial(repo.find_by_ids, projection=projection))
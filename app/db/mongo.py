@@ -5,45 +5,89 @@ from __future__ import annotations
 from typing import Any
 
 import certifi
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from bson.codec_options import CodecOptions
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
 
 from app.core.config import settings
 
+# Built once; every collection taken from the database inherits it by reference
+CODEC_OPTIONS: CodecOptions[dict[str, Any]] = CodecOptions(tz_aware=False)
+
 # Global MongoDB client and database instances
-_client: AsyncIOMotorClient[Any] | None = None
-_db: AsyncIOMotorDatabase[Any] | None = None
+_client: AsyncMongoClient[Any] | None = None
+_db: AsyncDatabase[Any] | None = None
+# Number of open connect_to_mongodb() calls sharing the client above
+_refs = 0
 
 
-async def connect_to_mongodb() -> None:
-    """Initialize MongoDB connection."""
-    global _client, _db
+def mongo_client_options(mongodb_url: str) -> dict[str, Any]:
+    """
+    Client options for connecting to mongodb_url, shared by the app and scripts.
 
-    client_options = {}
-    if "localhost" not in settings.mongodb_url and "127.0.0.1" not in settings.mongodb_url:
+    Remote hosts (e.g. Atlas) are verified against certifi's CA bundle, since
+    the system store may lack the needed root certificates.
+    """
+    client_options: dict[str, Any] = {
+        "maxPoolSize": settings.mongodb_max_pool_size,
+        "minPoolSize": settings.mongodb_min_pool_size,
+        "maxIdleTimeMS": settings.mongodb_max_idle_time_ms,
+        "retryWrites": True,
+    }
+    if "localhost" not in mongodb_url and "127.0.0.1" not in mongodb_url:
         client_options["tlsCAFile"] = certifi.where()
+    return client_options
+
+
+async def connect_to_mongodb() -> None:
+    """
+    Initialize MongoDB connection.
 
-    _client = AsyncIOMotorClient(settings.mongodb_url, **client_options)  # type: ignore[arg-type]
-    _db = _client[settings.mongodb_db]
+    Reentrant: nested callers (several app lifespans, or a test fixture
+    wrapping an app) share one client and its connection pool, which is
+    only closed once every caller has called close_mongodb_connection().
+    """
+    global _client, _db, _refs
+
+    if _client is not None:
+        _refs += 1
+        return
+
+    client: AsyncMongoClient[Any] = AsyncMongoClient(
+        settings.mongodb_url, **mongo_client_options(settings.mongodb_url)
+    )
 
     # Verify connection
     try:
-        await _client.admin.command("ping")
+        await client.admin.command("ping")
         print(f"✅ Connected to MongoDB: {settings.mongodb_db}")
     except Exception as e:
         print(f"❌ Failed to connect to MongoDB: {e}")
+        await client.close()
         raise
 
+    _client = client
+    _db = client.get_database(settings.mongodb_db, codec_options=CODEC_OPTIONS)
+    _refs = 1
+
 
 async def close_mongodb_connection() -> None:
-    """Close MongoDB connection."""
-    global _client
+    """Release one connect_to_mongodb() call, closing the client after the last."""
+    global _client, _db, _refs
+
+    if _client is None:
+        return
+
+    _refs -= 1
+    if _refs > 0:
+        return
 
-    if _client:
-        _client.close()
-        print("✅ Closed MongoDB connection")
+    client, _client, _db = _client, None, None
+    await client.close()
+    print("✅ Closed MongoDB connection")
 
 
-def get_database() -> AsyncIOMotorDatabase[Any]:
+def get_database() -> AsyncDatabase[Any]:
     """Get the MongoDB database instance."""
     if _db is None:
         raise RuntimeError("Database not initialized. Call connect_to_mongodb() first.")
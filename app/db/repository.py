@@ -2,21 +2,48 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Mapping
 from datetime import UTC
+from types import MappingProxyType
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
-
+from bson.errors import InvalidId
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.core.config import settings
+from app.db.cache import TTLCache
+from app.db.collation import CASE_INSENSITIVE
+from app.db.ids import parse_object_id
 from app.domain.users.value_objects import UserRole
 
+# List views never need credentials; pass projection=None for full documents.
+# Shared by reference as a default argument, so it is read-only.
+USER_LIST_PROJECTION: Mapping[str, Any] = MappingProxyType({"hashed_password": 0})
+
+# Everything the login, password reset and invite flows read from a user looked up by email
+AUTH_PROJECTION: Mapping[str, Any] = MappingProxyType(
+    {"email": 1, "name": 1, "role": 1, "is_active": 1, "hashed_password": 1}
+)
+
+# Unique email index built with CASE_INSENSITIVE; queries must pass the collation to use it
+EMAIL_INDEX_NAME = "email_ci"
+
+# Auth resolves the current user on every request; absorb bursts per process.
+# Entries are keyed by ("id", hex) and ("email", as given), tagged with the user's
+# hex ID, and dropped by that tag on writes. Off by default: invalidation is per
+# process, so other workers would keep serving a deactivated or demoted user
+# until the TTL expires.
+user_cache = TTLCache(maxsize=4096, ttl=settings.user_cache_ttl_seconds)
+
 
 class UserRepository:
     """Repository for User aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["users"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["users"]
 
     async def create_user(
         self,
@@ -41,7 +68,9 @@ class UserRepository:
             ValueError: If email already exists
         """
         # Check if email exists (case-insensitive)
-        existing = await self.collection.find_one({"email": email.lower()})
+        existing = await self.collection.find_one(
+            {"email": email}, {"_id": 1}, collation=CASE_INSENSITIVE
+        )
         if existing:
             raise ValueError(f"User with email {email} already exists")
 
@@ -66,9 +95,19 @@ class UserRepository:
             email: User email
 
         Returns:
-            User document if found, None otherwise
+            User document limited to AUTH_PROJECTION fields if found, None otherwise
         """
-        return await self.collection.find_one({"email": email.lower()})
+        key = ("email", email)
+        cached = user_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        # The collation folds case server-side and matches the unique email index
+        user_doc = await self.collection.find_one(
+            {"email": email}, AUTH_PROJECTION, collation=CASE_INSENSITIVE
+        )
+        self._remember(key, user_doc)
+        return user_doc
 
     async def find_by_id(self, user_id: str) -> dict[str, Any] | None:
         """
@@ -80,26 +119,98 @@ class UserRepository:
         Returns:
             User document if found, None otherwise
         """
+        key = ("id", user_id)
+        cached = user_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            return await self.collection.find_one({"_id": ObjectId(user_id)})
-        except Exception:
+            user_doc = await self.collection.find_one({"_id": parse_object_id(user_id)})
+        except InvalidId:
             return None
 
-    async def get_all_users(self) -> list[dict[str, Any]]:
-        """Get all users from database."""
-        return await self.collection.find().to_list(length=None)
+        self._remember(key, user_doc)
+        return user_doc
+
+    @staticmethod
+    def _remember(key: tuple[str, str], user_doc: dict[str, Any] | None) -> None:
+        # Misses are not cached so a just-registered user is visible immediately
+        if user_doc is not None:
+            user_cache.set(key, dict(user_doc), tag=str(user_doc["_id"]))
+
+    @staticmethod
+    def _forget(user_ids: set[str]) -> None:
+        for user_id in user_ids:
+            user_cache.invalidate_tag(user_id)
+
+    async def find_by_ids(
+        self,
+        user_ids: list[ObjectId],
+        projection: Mapping[str, Any] | None = USER_LIST_PROJECTION,
+    ) -> list[dict[str, Any]]:
+        """
+        Find several users in a single query.
+
+        Args:
+            user_ids: MongoDB ObjectIds
+            projection: Fields to include/exclude (defaults to everything but credentials)
+
+        Returns:
+            User documents that exist, in no particular order
+        """
+        return await self.collection.find({"_id": {"$in": user_ids}}, projection).to_list(
+            length=None
+        )
+
+    async def get_all_users(
+        self, projection: Mapping[str, Any] | None = USER_LIST_PROJECTION
+    ) -> list[dict[str, Any]]:
+        """
+        Get all users from database.
+
+        Args:
+            projection: Fields to include/exclude (defaults to omitting the password hash)
+
+        Returns:
+            List of user documents
+        """
+        return await self.collection.find({}, projection).to_list(length=None)
+
+    async def iter_users(
+        self,
+        query: dict[str, Any] | None = None,
+        projection: Mapping[str, Any] | None = USER_LIST_PROJECTION,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Stream users matching a query without materializing the result set.
 
-    async def find_users_by_role(self, role: UserRole) -> list[dict[str, Any]]:
+        Args:
+            query: Optional filter (defaults to all users)
+            projection: Fields to include/exclude (defaults to omitting the password hash)
+
+        Yields:
+            User documents as the cursor fetches them
+        """
+        async for doc in self.collection.find(query or {}, projection):
+            yield doc
+
+    async def find_users_by_role(
+        self, role: UserRole, projection: Mapping[str, Any] | None = USER_LIST_PROJECTION
+    ) -> list[dict[str, Any]]:
         """
         Find all users with a specific role.
 
         Args:
             role: User role to filter by
+            projection: Fields to include/exclude (defaults to omitting the password hash)
 
         Returns:
             List of user documents with the specified role
         """
-        return await self.collection.find({"role": role}).to_list(length=None)
+        # Query with the stored string so the role index is used without enum encoding
+        return await self.collection.find({"role": UserRole(role).value}, projection).to_list(
+            length=None
+        )
 
     async def update_user_role(self, user_id: str, new_role: UserRole) -> bool:
         """
@@ -114,11 +225,12 @@ class UserRepository:
         """
         try:
             result = await self.collection.update_one(
-                {"_id": ObjectId(user_id)},
-                {"$set": {"role": new_role}},
+                {"_id": parse_object_id(user_id)},
+                {"$set": {"role": UserRole(new_role).value}},
             )
+            self._forget({user_id})
             return result.modified_count > 0
-        except Exception:
+        except InvalidId:
             return False
 
     async def update_user_status(self, user_id: str, is_active: bool) -> bool:
@@ -134,11 +246,12 @@ class UserRepository:
         """
         try:
             result = await self.collection.update_one(
-                {"_id": ObjectId(user_id)},
+                {"_id": parse_object_id(user_id)},
                 {"$set": {"is_active": is_active}},
             )
+            self._forget({user_id})
             return result.modified_count > 0
-        except Exception:
+        except InvalidId:
             return False
 
     async def delete_user(self, user_id: str) -> bool:
@@ -152,15 +265,20 @@ class UserRepository:
             True if deleted, False if user not found
         """
         try:
-            result = await self.collection.delete_one({"_id": ObjectId(user_id)})
+            result = await self.collection.delete_one({"_id": parse_object_id(user_id)})
+            self._forget({user_id})
             return result.deleted_count > 0
-        except Exception:
+        except InvalidId:
             return False
 
     async def create_indexes(self) -> None:
         """Create necessary database indexes for performance."""
-        # Create unique index on email for fast lookups and uniqueness
-        await self.collection.create_index("email", unique=True)
+        # Case-insensitive unique index on email; supersedes the old binary email_1 index
+        await self.collection.create_index(
+            "email", unique=True, collation=CASE_INSENSITIVE, name=EMAIL_INDEX_NAME
+        )
+        if "email_1" in await self.collection.index_information():
+            await self.collection.drop_index("email_1")
 
         # Create indexes for common queries
         await self.collection.create_index("role")
@@ -179,11 +297,12 @@ class UserRepository:
         """
         try:
             result = await self.collection.update_one(
-                {"_id": ObjectId(user_id)},
+                {"_id": parse_object_id(user_id)},
                 {"$set": {"hashed_password": hashed_password}},
             )
+            self._forget({user_id})
             return result.modified_count > 0
-        except Exception:
+        except InvalidId:
             return False
 
     async def update_name(self, user_id: str, name: str) -> bool:
@@ -199,11 +318,12 @@ class UserRepository:
         """
         try:
             result = await self.collection.update_one(
-                {"_id": ObjectId(user_id)},
+                {"_id": parse_object_id(user_id)},
                 {"$set": {"name": name}},
             )
+            self._forget({user_id})
             return result.modified_count > 0
-        except Exception:
+        except InvalidId:
             return False
 
     async def create_password_reset_token(
@@ -223,27 +343,23 @@ class UserRepository:
         Returns:
             True if created successfully
         """
-        try:
-            # Get password_reset_tokens collection
-            reset_collection: AsyncIOMotorCollection[dict[str, Any]] = self.collection.database[
-                "password_reset_tokens"
-            ]
-
-            # Delete any existing tokens for this user
-            await reset_collection.delete_many({"user_id": user_id})
-
-            # Create new token
-            await reset_collection.insert_one(
-                {
-                    "user_id": user_id,
-                    "token": token,
-                    "expires_at": expires_at,
-                    "used": False,
-                }
-            )
-            return True
-        except Exception:
-            return False
+        # Get password_reset_tokens collection
+        reset_collection: AsyncCollection[dict[str, Any]] = self.collection.database[
+            "password_reset_tokens"
+        ]
+
+        # Replace any existing token for this user in a single atomic upsert
+        await reset_collection.replace_one(
+            {"user_id": user_id},
+            {
+                "user_id": user_id,
+                "token": token,
+                "expires_at": expires_at,
+                "used": False,
+            },
+            upsert=True,
+        )
+        return True
 
     async def find_password_reset_token(self, token: str) -> dict[str, Any] | None:
         """
@@ -255,61 +371,65 @@ class UserRepository:
         Returns:
             Token document if found and valid, None otherwise
         """
-        try:
-            from datetime import datetime
-
-            reset_collection: AsyncIOMotorCollection[dict[str, Any]] = self.collection.database[
-                "password_reset_tokens"
-            ]
-
-            token_doc = await reset_collection.find_one(
-                {
-                    "token": token,
-                    "used": False,
-                    "expires_at": {"$gt": datetime.now(UTC)},
-                }
-            )
-            return token_doc
-        except Exception:
-            return None
+        from datetime import datetime
+
+        reset_collection: AsyncCollection[dict[str, Any]] = self.collection.database[
+            "password_reset_tokens"
+        ]
+
+        token_doc = await reset_collection.find_one(
+            {
+                "token": token,
+                "used": False,
+                "expires_at": {"$gt": datetime.now(UTC)},
+            }
+        )
+        return token_doc
 
     async def delete_password_reset_token(self, token: str) -> bool:
         """
-        Mark a password reset token as used.
+        Delete a password reset token once it has been used.
 
         Args:
-            token: Reset token to mark as used
+            token: Reset token to delete
 
         Returns:
-            True if marked successfully
+            True if deleted successfully
         """
-        try:
-            reset_collection: AsyncIOMotorCollection[dict[str, Any]] = self.collection.database[
-                "password_reset_tokens"
-            ]
+        reset_collection: AsyncCollection[dict[str, Any]] = self.collection.database[
+            "password_reset_tokens"
+        ]
 
-            result = await reset_collection.update_one(
-                {"token": token},
-                {"$set": {"used": True}},
-            )
-            return result.modified_count > 0
-        except Exception:
-            return False
+        result = await reset_collection.delete_one({"token": token})
+        return result.deleted_count > 0
 
     async def create_password_reset_indexes(self) -> None:
         """Create indexes for password reset tokens collection."""
-        try:
-            reset_collection: AsyncIOMotorCollection[dict[str, Any]] = self.collection.database[
-                "password_reset_tokens"
-            ]
-
-            # Create TTL index to automatically delete expired tokens
-            await reset_collection.create_index("expires_at", expireAfterSeconds=0)
-
-            # Create index on token for fast lookups
-            await reset_collection.create_index("token")
-
-            # Create index on user_id
-            await reset_collection.create_index("user_id")
-        except Exception:
-            pass
+        reset_collection: AsyncCollection[dict[str, Any]] = self.collection.database[
+            "password_reset_tokens"
+        ]
+
+        # Create TTL index to automatically delete expired tokens
+        await reset_collection.create_index("expires_at", expireAfterSeconds=0)
+
+        # Create index on token for fast lookups
+        await reset_collection.create_index("token")
+
+        # One token per user, so the upsert always targets a single document.
+        # The unique index supersedes the old non-unique user_id_1 index, which
+        # has the same name and must be dropped first; users left with several
+        # tokens by the old index keep only their newest one.
+        index_info = await reset_collection.index_information()
+        if not index_info.get("user_id_1", {}).get("unique"):
+            if "user_id_1" in index_info:
+                await reset_collection.drop_index("user_id_1")
+            duplicate_cursor = await reset_collection.aggregate(
+                [
+                    {"$group": {"_id": "$user_id", "ids": {"$push": "$_id"}}},
+                    {"$match": {"ids.1": {"$exists": True}}},
+                ]
+            )
+            async for group in duplicate_cursor:
+                stale_ids = sorted(group["ids"])[:-1]
+                await reset_collection.delete_many({"_id": {"$in": stale_ids}})
+        await reset_collection.create_index("user_id", unique=True)
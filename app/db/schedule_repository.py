@@ -2,18 +2,30 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator, Mapping
+from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any
 
-from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from bson.errors import InvalidId
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+
+from app.db.ids import parse_object_id
+
+# Public listings expose neither tutor resources nor the meeting link
+PUBLIC_SCHEDULE_PROJECTION: Mapping[str, Any] = MappingProxyType({"resources": 0, "meeting_url": 0})
+
+# Constant update fragment shared by every write that bumps updated_at
+_TOUCH_UPDATED_AT: Mapping[str, Any] = MappingProxyType({"updated_at": True})
 
 
 class ScheduleRepository:
     """Repository for Schedule aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["schedules"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["schedules"]
 
     async def create_schedule(
         self,
@@ -25,17 +37,18 @@ class ScheduleRepository:
         timezone: str = "UTC",
     ) -> dict[str, Any]:
         """Create a new schedule."""
+        now = datetime.now(UTC)
         schedule_doc: dict[str, Any] = {
-            "course_id": ObjectId(course_id),
-            "tutor_id": ObjectId(tutor_id),
+            "course_id": parse_object_id(course_id),
+            "tutor_id": parse_object_id(tutor_id),
             "sessions": sessions,
             "capacity": capacity,
             "enrollment_count": 0,
             "status": "UPCOMING",
             "meeting_url": meeting_url,
             "timezone": timezone,
-            "created_at": ObjectId().generation_time,
-            "updated_at": ObjectId().generation_time,
+            "created_at": now,
+            "updated_at": now,
         }
 
         result = await self.collection.insert_one(schedule_doc)
@@ -46,34 +59,37 @@ class ScheduleRepository:
     async def find_by_id(self, schedule_id: str) -> dict[str, Any] | None:
         """Find a schedule by ID."""
         try:
-            return await self.collection.find_one({"_id": ObjectId(schedule_id)})
-        except Exception:
+            return await self.collection.find_one({"_id": parse_object_id(schedule_id)})
+        except InvalidId:
             return None
 
-    async def get_schedules_by_course(self, course_id: str) -> list[dict[str, Any]]:
+    async def get_schedules_by_course(
+        self, course_id: str, projection: Mapping[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Get all schedules for a course."""
         try:
-            course_ids: list[Any] = [course_id]
-            if ObjectId.is_valid(course_id):
-                course_ids.append(ObjectId(course_id))
-            return await self.collection.find({"course_id": {"$in": course_ids}}).to_list(
-                length=None
-            )
-        except Exception:
+            return await self.collection.find(
+                {"course_id": parse_object_id(course_id)}, projection
+            ).to_list(length=None)
+        except InvalidId:
             return []
 
-    async def get_schedules_by_tutor(self, tutor_id: str) -> list[dict[str, Any]]:
+    async def get_schedules_by_tutor(
+        self, tutor_id: str, projection: Mapping[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Get all schedules for a tutor."""
         try:
-            tutor_ids: list[Any] = [tutor_id]
-            if ObjectId.is_valid(tutor_id):
-                tutor_ids.append(ObjectId(tutor_id))
-            return await self.collection.find({"tutor_id": {"$in": tutor_ids}}).to_list(length=None)
-        except Exception:
+            return await self.collection.find(
+                {"tutor_id": parse_object_id(tutor_id)}, projection
+            ).to_list(length=None)
+        except InvalidId:
             return []
 
     async def get_upcoming_schedules(
-        self, course_id: str | None = None, tutor_id: str | None = None
+        self,
+        course_id: str | None = None,
+        tutor_id: str | None = None,
+        projection: Mapping[str, Any] | None = PUBLIC_SCHEDULE_PROJECTION,
     ) -> list[dict[str, Any]]:
         """
         Get upcoming schedules with optional filters.
@@ -81,32 +97,34 @@ class ScheduleRepository:
         Args:
             course_id: Optional course ID filter
             tutor_id: Optional tutor ID filter
+            projection: Fields to include/exclude (defaults to the public listing fields)
 
         Returns:
             List of upcoming schedules
         """
         try:
+            # Equality on status first so the (status, course_id/tutor_id) indexes apply
             query: dict[str, Any] = {"status": "UPCOMING"}
+            for field, value in (("course_id", course_id), ("tutor_id", tutor_id)):
+                if value:
+                    query[field] = parse_object_id(value)
 
-            if course_id:
-                course_ids: list[Any] = [course_id]
-                if ObjectId.is_valid(course_id):
-                    course_ids.append(ObjectId(course_id))
-                query["course_id"] = {"$in": course_ids}
-
-            if tutor_id:
-                tutor_ids: list[Any] = [tutor_id]
-                if ObjectId.is_valid(tutor_id):
-                    tutor_ids.append(ObjectId(tutor_id))
-                query["tutor_id"] = {"$in": tutor_ids}
-
-            return await self.collection.find(query).to_list(length=None)
-        except Exception:
+            return await self.collection.find(query, projection).to_list(length=None)
+        except InvalidId:
             return []
 
-    async def get_all_schedules(self) -> list[dict[str, Any]]:
+    async def get_all_schedules(
+        self, projection: Mapping[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
         """Get all schedules."""
-        return await self.collection.find().to_list(length=None)
+        return await self.collection.find({}, projection).to_list(length=None)
+
+    async def iter_all_schedules(
+        self, projection: Mapping[str, Any] | None = None
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Stream all schedules without materializing the result set."""
+        async for doc in self.collection.find({}, projection):
+            yield doc
 
     async def update_schedule(
         self,
@@ -123,7 +141,7 @@ class ScheduleRepository:
             update_data: dict[str, Any] = {}
 
             if tutor_id is not None:
-                update_data["tutor_id"] = ObjectId(tutor_id)
+                update_data["tutor_id"] = parse_object_id(tutor_id)
             if sessions is not None:
                 update_data["sessions"] = sessions
             if capacity is not None:
@@ -138,30 +156,50 @@ class ScheduleRepository:
             if not update_data:
                 return await self.find_by_id(schedule_id)
 
-            update_data["updated_at"] = ObjectId().generation_time
-
             result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(schedule_id)},
-                {"$set": update_data},
+                {"_id": parse_object_id(schedule_id)},
+                {"$set": update_data, "$currentDate": _TOUCH_UPDATED_AT},
                 return_document=True,
             )
             return result
-        except Exception:
+        except InvalidId:
             return None
 
     async def delete_schedule(self, schedule_id: str) -> bool:
         """Delete a schedule."""
         try:
-            result = await self.collection.delete_one({"_id": ObjectId(schedule_id)})
+            result = await self.collection.delete_one({"_id": parse_object_id(schedule_id)})
             return result.deleted_count > 0
-        except Exception:
+        except InvalidId:
             return False
 
+    async def normalize_reference_ids(self) -> int:
+        """
+        Convert legacy string course_id/tutor_id values to ObjectId.
+
+        Older schedules (e.g. seeded data) stored references as hex strings,
+        which forced every filter to match both representations.
+
+        Returns:
+            Number of schedules rewritten
+        """
+        modified = 0
+        for field in ("course_id", "tutor_id"):
+            result = await self.collection.update_many(
+                {field: {"$type": "string", "$regex": "^[0-9a-fA-F]{24}$"}},
+                [{"$set": {field: {"$toObjectId": f"${field}"}}}],
+            )
+            modified += result.modified_count
+        return modified
+
     async def create_indexes(self) -> None:
         """Create indexes."""
         await self.collection.create_index("course_id")
         await self.collection.create_index("tutor_id")
         await self.collection.create_index("status")
+        # Equality-first compound indexes for the upcoming-schedules filters
+        await self.collection.create_index([("status", 1), ("course_id", 1)])
+        await self.collection.create_index([("status", 1), ("tutor_id", 1)])
 
     # Resource CRUD methods
 
@@ -171,15 +209,15 @@ class ScheduleRepository:
         """Add a resource to a schedule."""
         try:
             result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(schedule_id)},
+                {"_id": parse_object_id(schedule_id)},
                 {
                     "$push": {"resources": resource},
-                    "$set": {"updated_at": ObjectId().generation_time},
+                    "$currentDate": _TOUCH_UPDATED_AT,
                 },
                 return_document=True,
             )
             return result
-        except Exception:
+        except InvalidId:
             return None
 
     async def update_resource(
@@ -196,53 +234,49 @@ class ScheduleRepository:
             if not update_fields:
                 return await self.find_by_id(schedule_id)
 
-            update_fields["updated_at"] = ObjectId().generation_time
-
             result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(schedule_id)},
-                {"$set": update_fields},
+                {"_id": parse_object_id(schedule_id)},
+                {"$set": update_fields, "$currentDate": _TOUCH_UPDATED_AT},
                 return_document=True,
             )
             return result
-        except Exception:
+        except InvalidId:
             return None
 
     async def delete_resource(self, schedule_id: str, resource_index: int) -> dict[str, Any] | None:
         """Delete a resource at a specific index from a schedule."""
-        try:
-            # First, get the current schedule to validate index
-            schedule = await self.find_by_id(schedule_id)
-            if not schedule:
-                return None
-
-            resources = schedule.get("resources", [])
-            if resource_index < 0 or resource_index >= len(resources):
-                return None
+        if resource_index < 0:
+            return None
 
-            # Remove the resource at the specified index
-            resources.pop(resource_index)
+        try:
+            # Splice the element out server-side in one atomic update; the filter
+            # only matches when the index exists, so no prior read is needed
+            before: Any = {"$slice": ["$resources", resource_index]} if resource_index else []
+            after = {"$slice": ["$resources", resource_index + 1, {"$size": "$resources"}]}
 
             result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(schedule_id)},
                 {
-                    "$set": {
-                        "resources": resources,
-                        "updated_at": ObjectId().generation_time,
-                    }
+                    "_id": parse_object_id(schedule_id),
+                    f"resources.{resource_index}": {"$exists": True},
                 },
+                [
+                    {
+                        "$set": {
+                            "resources": {"$concatArrays": [before, after]},
+                            "updated_at": "$$NOW",
+                        }
+                    }
+                ],
                 return_document=True,
             )
             return result
-        except Exception:
+        except InvalidId:
             return None
 
     async def get_resources(self, schedule_id: str) -> list[dict[str, Any]] | None:
         """Get all resources for a schedule."""
-        try:
-            schedule = await self.find_by_id(schedule_id)
-            if not schedule:
-                return None
-            resources: list[dict[str, Any]] = schedule.get("resources", [])
-            return resources
-        except Exception:
+        schedule = await self.find_by_id(schedule_id)
+        if not schedule:
             return None
+        resources: list[dict[str, Any]] = schedule.get("resources", [])
+        return resources
@@ -2,18 +2,37 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+from datetime import UTC, datetime
+from types import MappingProxyType
 from typing import Any
 
-from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
+from bson.errors import InvalidId
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import DuplicateKeyError
+
+from app.core.config import settings
+from app.db.cache import TTLCache
+from app.db.ids import parse_object_id
+
+# Vendors change rarely but are looked up for every certification write.
+# Entries are keyed by ("id", hex) and ("name", name), tagged with the vendor's
+# hex ID, and dropped by that tag on writes.
+vendor_cache = TTLCache(maxsize=1024, ttl=settings.vendor_cache_ttl_seconds)
+
+# Fields served by the vendor API
+VENDOR_PROJECTION: Mapping[str, Any] = MappingProxyType(
+    {"name": 1, "description": 1, "logo": 1, "created_at": 1, "updated_at": 1}
+)
 
 
 class VendorRepository:
     """Repository for Vendor aggregate using MongoDB."""
 
-    def __init__(self, db: AsyncIOMotorDatabase[Any]) -> None:
+    def __init__(self, db: AsyncDatabase[Any]) -> None:
         """Initialize with MongoDB database instance."""
-        self.collection: AsyncIOMotorCollection[dict[str, Any]] = db["vendors"]
+        self.collection: AsyncCollection[dict[str, Any]] = db["vendors"]
 
     async def create_vendor(
         self,
@@ -35,20 +54,20 @@ class VendorRepository:
         Raises:
             ValueError: If vendor with same name already exists
         """
-        # Check if vendor with same name already exists
-        existing = await self.collection.find_one({"name": name})
-        if existing:
-            raise ValueError(f"Vendor with name '{name}' already exists")
-
+        now = datetime.now(UTC)
         vendor_doc: dict[str, Any] = {
             "name": name,
             "description": description,
             "logo": logo,
-            "created_at": ObjectId().generation_time,
-            "updated_at": ObjectId().generation_time,
+            "created_at": now,
+            "updated_at": now,
         }
 
-        result = await self.collection.insert_one(vendor_doc)
+        # The unique name index rejects duplicates atomically, so no pre-check is needed
+        try:
+            result = await self.collection.insert_one(vendor_doc)
+        except DuplicateKeyError as e:
+            raise ValueError(f"Vendor with name '{name}' already exists") from e
         vendor_doc["_id"] = result.inserted_id
 
         return vendor_doc
@@ -63,11 +82,19 @@ class VendorRepository:
         Returns:
             Vendor document if found, None otherwise
         """
+        key = ("id", vendor_id)
+        cached = vendor_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
         try:
-            return await self.collection.find_one({"_id": ObjectId(vendor_id)})
-        except Exception:
+            vendor_doc = await self.collection.find_one({"_id": parse_object_id(vendor_id)})
+        except InvalidId:
             return None
 
+        self._remember(key, vendor_doc)
+        return vendor_doc
+
     async def find_by_name(self, name: str) -> dict[str, Any] | None:
         """
         Find a vendor by name.
@@ -78,11 +105,52 @@ class VendorRepository:
         Returns:
             Vendor document if found, None otherwise
         """
-        return await self.collection.find_one({"name": name})
+        key = ("name", name)
+        cached = vendor_cache.get(key)
+        if cached is not None:
+            return dict(cached)
+
+        vendor_doc = await self.collection.find_one({"name": name})
+        self._remember(key, vendor_doc)
+        return vendor_doc
+
+    @staticmethod
+    def _remember(key: tuple[str, str], vendor_doc: dict[str, Any] | None) -> None:
+        # Misses are not cached so a just-created vendor is visible immediately
+        if vendor_doc is not None:
+            vendor_cache.set(key, dict(vendor_doc), tag=str(vendor_doc["_id"]))
+
+    @staticmethod
+    def _forget(vendor_id: str) -> None:
+        vendor_cache.invalidate_tag(vendor_id)
+
+    async def get_all_vendors(
+        self,
+        *,
+        limit: int | None = None,
+        after_id: str | None = None,
+        projection: Mapping[str, Any] | None = VENDOR_PROJECTION,
+    ) -> list[dict[str, Any]]:
+        """
+        Get vendors in _id order, optionally one page at a time.
+
+        Args:
+            limit: Maximum number of vendors to return (all if None)
+            after_id: Return only vendors after this ID (the last ID of the previous page)
+            projection: Fields to include/exclude (defaults to the API fields)
+
+        Returns:
+            List of vendor documents; empty if after_id is malformed
+        """
+        try:
+            query = {"_id": {"$gt": parse_object_id(after_id)}} if after_id else {}
+        except InvalidId:
+            return []
 
-    async def get_all_vendors(self) -> list[dict[str, Any]]:
-        """Get all vendors from database."""
-        return await self.collection.find().to_list(length=None)
+        cursor = self.collection.find(query, projection).sort("_id", 1)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        return await cursor.to_list(length=limit)
 
     async def update_vendor(
         self,
@@ -102,39 +170,33 @@ class VendorRepository:
 
         Returns:
             Updated vendor document if found and updated, None otherwise
+
+        Raises:
+            ValueError: If another vendor already has the new name
         """
         try:
-            update_data: dict[str, Any] = {}
-            if name is not None:
-                # Check if new name already exists
-                existing = await self.collection.find_one(
-                    {"name": name, "_id": {"$ne": ObjectId(vendor_id)}}
-                )
-                if existing:
-                    raise ValueError(f"Vendor with name '{name}' already exists")
-                update_data["name"] = name
-
-            if description is not None:
-                update_data["description"] = description
-
-            if logo is not None:
-                update_data["logo"] = logo
+            update_data: dict[str, Any] = {
+                field: value
+                for field, value in (("name", name), ("description", description), ("logo", logo))
+                if value is not None
+            }
 
             if not update_data:
-                # No changes to make
+                # No changes to make; a single read still distinguishes a missing vendor
                 return await self.find_by_id(vendor_id)
 
-            update_data["updated_at"] = ObjectId().generation_time
-
+            # One atomic write: the unique name index enforces dedupe and the
+            # server stamps updated_at
             result = await self.collection.find_one_and_update(
-                {"_id": ObjectId(vendor_id)},
-                {"$set": update_data},
+                {"_id": parse_object_id(vendor_id)},
+                {"$set": update_data, "$currentDate": {"updated_at": True}},
                 return_document=True,
             )
+            self._forget(vendor_id)
             return result
-        except ValueError:
-            raise
-        except Exception:
+        except DuplicateKeyError as e:
+            raise ValueError(f"Vendor with name '{name}' already exists") from e
+        except InvalidId:
             return None
 
     async def delete_vendor(self, vendor_id: str) -> bool:
@@ -148,12 +210,15 @@ class VendorRepository:
             True if deleted, False if vendor not found
         """
         try:
-            result = await self.collection.delete_one({"_id": ObjectId(vendor_id)})
+            result = await self.collection.delete_one({"_id": parse_object_id(vendor_id)})
+            self._forget(vendor_id)
             return result.deleted_count > 0
-        except Exception:
+        except InvalidId:
             return False
 
     async def create_indexes(self) -> None:
         """Create necessary database indexes for performance."""
-        # Create unique index on name for fast lookups and uniqueness
+        # Create unique index on name for fast lookups and uniqueness. Creates and
+        # renames rely on it alone, so unlike categories and job roles no
+        # (name, _id) index is needed for a rename duplicate query.
         await self.collection.create_index("name", unique=True)
@@ -13,6 +13,8 @@ class Certification:
     Represents a certification provided by a vendor.
     """
 
+    __slots__ = ("id", "vendor_id", "name", "description", "url", "created_at", "updated_at")
+
     def __init__(
         self,
         id: str,
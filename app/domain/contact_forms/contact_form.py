@@ -7,9 +7,10 @@ from __future__ import annotations
 
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, Field
 from pydantic.config import ConfigDict
 
+from app.domain.contact_forms.value_objects import ContactEmail
 from app.domain.users.value_objects import utcnow
 
 
@@ -20,7 +21,7 @@ class ContactForm(BaseModel):
 
     id: str = Field(...)
     name: str = Field(min_length=1, max_length=200)
-    email: EmailStr = Field(...)
+    email: ContactEmail = Field(...)
     subject: str = Field(min_length=1, max_length=500)
     message: str = Field(min_length=1, max_length=5000)
     created_at: datetime = Field(default_factory=utcnow)
@@ -1,6 +1,15 @@
 """Value objects for contact forms."""
 
 from enum import StrEnum, auto
+from typing import Annotated
+
+from pydantic import StringConstraints
+
+# Shape check only (one @, a dotted domain, no whitespace); replies go out by
+# email anyway, so the full email-validator pass is not worth it per request
+ContactEmail = Annotated[
+    str, StringConstraints(strip_whitespace=True, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+]
 
 
 class ContactFormStatus(StrEnum):
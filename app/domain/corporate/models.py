@@ -51,8 +51,8 @@ class CorporateAccount(BaseModel):
     phone: str | None = None
     status: AccountStatus = Field(default=AccountStatus.PENDING)
 
-    # Store IDs of admin users for this account
-    admin_user_ids: list[str] = Field(default_factory=list)
+    # Store IDs of admin users for this account (immutable, like the model itself)
+    admin_user_ids: tuple[str, ...] = Field(default_factory=tuple)
 
     created_at: datetime = Field(default_factory=utcnow)
     updated_at: datetime = Field(default_factory=utcnow)
@@ -79,7 +79,7 @@ class CorporateAccount(BaseModel):
             address=address,
             phone=phone,
             status=AccountStatus.ACTIVE,  # Use ACTIVE by default for new registrations?
-            admin_user_ids=[admin_user_id],
+            admin_user_ids=(admin_user_id,),
             created_at=now,
             updated_at=now,
         )
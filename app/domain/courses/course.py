@@ -27,6 +27,8 @@ class CourseStatus(str, Enum):
 class SyllabusWeek:
     """Represents a week in the course syllabus."""
 
+    __slots__ = ("week", "title", "topics")
+
     def __init__(
         self,
         week: str,
@@ -66,6 +68,8 @@ class SyllabusWeek:
 class CourseDetails:
     """Represents detailed course information."""
 
+    __slots__ = ("overview", "objectives", "prerequisites", "syllabus")
+
     def __init__(
         self,
         overview: str,
@@ -93,13 +97,16 @@ class CourseDetails:
             "overview": self.overview,
             "objectives": self.objectives,
             "prerequisites": self.prerequisites,
-            "syllabus": [week.to_dict() for week in self.syllabus],
+            "syllabus": [
+                {"week": week.week, "title": week.title, "topics": week.topics}
+                for week in self.syllabus
+            ],
         }
 
     @classmethod
     def from_dict(cls, data: dict[str, Any]) -> CourseDetails:
         """Create from dictionary representation."""
-        syllabus = [SyllabusWeek.from_dict(week) for week in data.get("syllabus", [])]
+        syllabus = list(map(SyllabusWeek.from_dict, data.get("syllabus") or ()))
         return cls(
             overview=data["overview"],
             objectives=data["objectives"],
@@ -116,6 +123,31 @@ class Course:
     relationships to vendors, job roles, and categories.
     """
 
+    __slots__ = (
+        "id",
+        "title",
+        "description",
+        "duration",
+        "level",
+        "course_details",
+        "url",
+        "language",
+        "image",
+        "rating",
+        "students",
+        "certifications",
+        "cost",
+        "category_id",
+        "vendor_id",
+        "job_role_ids",
+        "resources",
+        "notice",
+        "tags",
+        "status",
+        "created_at",
+        "updated_at",
+    )
+
     def __init__(
         self,
         id: str,
@@ -160,7 +192,6 @@ class Course:
             cost: Optional course cost/price
             category_id: Optional reference to course category
             vendor_id: Optional reference to vendor
-            vendor_id: Optional reference to vendor
             job_role_ids: Optional list of related job role IDs
             resources: Optional list of resources (e.g. [{"title": "...", "url": "..."}])
             notice: Optional notice text
@@ -184,7 +215,6 @@ class Course:
         self.cost = cost
         self.category_id = category_id
         self.vendor_id = vendor_id
-        self.vendor_id = vendor_id
         self.job_role_ids = job_role_ids or []
         self.resources = resources or []
         self.notice = notice
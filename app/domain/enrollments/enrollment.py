@@ -8,6 +8,8 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
+from app.domain.users.value_objects import utcnow
+
 
 class EnrollmentStatus(str, Enum):
     """Enrollment status."""
@@ -28,6 +30,12 @@ class PaymentStatus(str, Enum):
     FAILED = "FAILED"
 
 
+# Plain dict lookups for decoding stored values; the enum call is only the
+# fallback that raises ValueError for unknown values
+_ENROLLMENT_STATUS_BY_VALUE = {member.value: member for member in EnrollmentStatus}
+_PAYMENT_STATUS_BY_VALUE = {member.value: member for member in PaymentStatus}
+
+
 class Enrollment(BaseModel):
     """Enrollment domain model."""
 
@@ -51,7 +59,7 @@ class Enrollment(BaseModel):
     stripe_charge_id: str | None = None
 
     # Timestamps
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=utcnow)
     paid_at: datetime | None = None
     enrolled_at: datetime  # When they officially became a student (often same as paid_at)
     completed_at: datetime | None = None
@@ -76,22 +84,26 @@ class Enrollment(BaseModel):
             raise ValueError("Data is empty")
 
         id_val = str(data["_id"])
+        status = data.get("status", "ENROLLED")
+        payment_status = data.get("payment_status", "PENDING")
         return cls(
             id=id_val,
             user_id=str(data["user_id"]),
             schedule_id=str(data["schedule_id"]),
             course_id=str(data["course_id"]),
-            status=EnrollmentStatus(data.get("status", "ENROLLED")),
+            status=_ENROLLMENT_STATUS_BY_VALUE.get(status) or EnrollmentStatus(status),
             amount_total=data.get("amount_total"),
             currency=data.get("currency", "cad"),
-            payment_status=PaymentStatus(data.get("payment_status", "PENDING")),
+            payment_status=(
+                _PAYMENT_STATUS_BY_VALUE.get(payment_status) or PaymentStatus(payment_status)
+            ),
             payment_method_type=data.get("payment_method_type"),
             receipt_email=data.get("receipt_email"),
             stripe_checkout_session_id=data.get("stripe_checkout_session_id"),
             stripe_payment_intent_id=data.get("stripe_payment_intent_id"),
             stripe_customer_id=data.get("stripe_customer_id"),
             stripe_charge_id=data.get("stripe_charge_id"),
-            created_at=data.get("created_at", datetime.utcnow()),
+            created_at=data.get("created_at") or utcnow(),
             paid_at=data.get("paid_at"),
             enrolled_at=data["enrolled_at"],
             completed_at=data.get("completed_at"),
@@ -13,6 +13,8 @@ class JobRole:
     Represents a job role in the system with name and description.
     """
 
+    __slots__ = ("id", "name", "description", "created_at", "updated_at")
+
     def __init__(
         self,
         id: str,
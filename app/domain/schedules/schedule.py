@@ -6,7 +6,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 
 class ScheduleStatus(str, Enum):
@@ -29,6 +29,8 @@ class ResourceType(str, Enum):
 class Resource(BaseModel):
     """Resource for a schedule."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=False)
+
     title: str | None = None
     type: ResourceType
     details: str | None = None
@@ -38,11 +40,27 @@ class Resource(BaseModel):
 class Session(BaseModel):
     """Individual course session."""
 
+    model_config = ConfigDict(frozen=True, extra="ignore", defer_build=False)
+
     date: datetime
     start_time: str
     end_time: str
 
 
+# Compiled list validators: pydantic-core walks each list in one call
+_SESSIONS_ADAPTER = TypeAdapter(list[Session])
+_RESOURCES_ADAPTER = TypeAdapter(list[Resource])
+
+# Plain dict lookup for decoding stored statuses; the enum call is only the
+# fallback that raises ValueError for unknown values
+_SCHEDULE_STATUS_BY_VALUE = {member.value: member for member in ScheduleStatus}
+
+
+def _schedule_status(value: str) -> ScheduleStatus:
+    """Resolve a stored status, raising ValueError for unknown values."""
+    return _SCHEDULE_STATUS_BY_VALUE.get(value) or ScheduleStatus(value)
+
+
 class Schedule(BaseModel):
     """Schedule domain model."""
 
@@ -59,11 +77,9 @@ class Schedule(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        """Pydantic config."""
-
-        populate_by_name = True
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    # Datetimes already serialize to ISO 8601 in pydantic v2, so the old
+    # json_encoders override is not needed
+    model_config = ConfigDict(populate_by_name=True, frozen=True, extra="ignore", defer_build=False)
 
     @classmethod
     def from_mongo(cls, data: dict[str, Any]) -> Schedule:
@@ -71,26 +87,22 @@ class Schedule(BaseModel):
         if not data:
             raise ValueError("Data is empty")
 
-        id_val = str(data["_id"])
-
-        # Handle sessions
-        sessions_data = data.get("sessions", [])
-        sessions = [Session(**s) for s in sessions_data]
+        # Each optional list is read once and only validated when non-empty
+        sessions_data = data.get("sessions")
+        resources_data = data.get("resources")
 
         return cls(
-            id=id_val,
+            id=str(data["_id"]),
             course_id=str(data["course_id"]),
             tutor_id=str(data["tutor_id"]),
-            sessions=sessions,
+            sessions=_SESSIONS_ADAPTER.validate_python(sessions_data) if sessions_data else [],
             capacity=data["capacity"],
             enrollment_count=data.get("enrollment_count", 0),
-            status=ScheduleStatus(data.get("status", "UPCOMING")),
+            status=_schedule_status(data.get("status", "UPCOMING")),
             meeting_url=data.get("meeting_url"),
             timezone=data.get("timezone", "UTC"),
             resources=(
-                [Resource(**r) for r in data.get("resources", [])]
-                if data.get("resources")
-                else None
+                _RESOURCES_ADAPTER.validate_python(resources_data) if resources_data else None
             ),
             created_at=data["created_at"],
             updated_at=data["updated_at"],
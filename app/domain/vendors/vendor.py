@@ -2,43 +2,33 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from datetime import datetime
 from typing import Any
 
 
+@dataclass(slots=True, frozen=True)
 class Vendor:
     """
     Vendor aggregate.
 
     Represents a vendor in the system with name, description, and logo.
+
+    Attributes:
+        id: Unique identifier (MongoDB ObjectId as string)
+        name: Vendor name
+        description: Vendor description
+        logo: Optional vendor logo URL
+        created_at: Creation timestamp
+        updated_at: Last update timestamp
     """
 
-    def __init__(
-        self,
-        id: str,
-        name: str,
-        description: str,
-        logo: str | None,
-        created_at: datetime,
-        updated_at: datetime,
-    ) -> None:
-        """
-        Initialize a Vendor.
-
-        Args:
-            id: Unique identifier (MongoDB ObjectId as string)
-            name: Vendor name
-            description: Vendor description
-            logo: Optional vendor logo URL
-            created_at: Creation timestamp
-            updated_at: Last update timestamp
-        """
-        self.id = id
-        self.name = name
-        self.description = description
-        self.logo = logo
-        self.created_at = created_at
-        self.updated_at = updated_at
+    id: str
+    name: str
+    description: str
+    logo: str | None
+    created_at: datetime
+    updated_at: datetime
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary representation."""
@@ -6,31 +6,68 @@ versioned routers at /api/v1. Exposes a module-level `app` for uvicorn:
 """
 
 import logging
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, AsyncExitStack, asynccontextmanager
 
+import orjson
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 
 from app.api.v1.routers import get_v1_router
-from app.db import close_mongodb_connection, connect_to_mongodb
+from app.core.config import settings
+from app.db import close_mongodb_connection, connect_to_mongodb, get_database
+from app.db.indexes import ensure_indexes
+
+logger = logging.getLogger(__name__)
+
+# The root payload never changes, so encode it once at import time
+_ROOT_BODY = orjson.dumps({"service": "fastapi-mongo-starter"})
+
+
+@asynccontextmanager
+async def _mongo_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Open the shared MongoDB client and ensure indexes; release it on exit."""
+    await connect_to_mongodb()
+    try:
+        await ensure_indexes(get_database())
+        yield
+    finally:
+        await close_mongodb_connection()
+
+
+@asynccontextmanager
+async def _openapi_lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Build and cache the OpenAPI schema so /docs and /openapi.json never pay for it."""
+    app.openapi()
+    yield
+
+
+# Sub-lifespans entered in order on startup and exited in reverse on shutdown.
+# Add new startup/shutdown concerns here rather than growing lifespan().
+_LIFESPANS: tuple[Callable[[FastAPI], AbstractAsyncContextManager[None]], ...] = (
+    _mongo_lifespan,
+    _openapi_lifespan,
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """
     App lifecycle manager.
-    Startup: Initialize MongoDB connection
-    Shutdown: Close MongoDB connection
+    Startup: enter each of _LIFESPANS (MongoDB connection and indexes, then
+    the OpenAPI schema)
+    Shutdown: exit them in reverse order
     """
-    # on_startup: Connect to MongoDB
-    await connect_to_mongodb()
+    async with AsyncExitStack() as stack:
+        for sub_lifespan in _LIFESPANS:
+            await stack.enter_async_context(sub_lifespan(app))
+        yield
 
-    yield
 
-    # on_shutdown: Close MongoDB connection
-    await close_mongodb_connection()
+async def root() -> Response:
+    """Service info, returned as a pre-encoded body."""
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 def create_app() -> FastAPI:
@@ -45,32 +82,21 @@ def create_app() -> FastAPI:
         version="1.0.0",
         description="Training track service — v1 API surface.",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
         docs_url="/docs",  # Swagger UI
         redoc_url="/redoc",  # ReDoc UI
         openapi_url="/openapi.json",  # OpenAPI spec
     )
 
-    # Configure CORS
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=[
-            "https://cencad.ca",
-            "https://www.cencad.ca",
-            "https://cencad.ca/*",
-            "https://www.cencad.ca/*",
-            "https://cencad-dev.netlify.app",
-            "https://www.cencad-dev.netlify.app",
-            "https://cencad-dev.netlify.app/*",
-            "https://www.cencad-dev.netlify.app/*",
-            "http://lo  calhost:3000",
-            "http://localhost:3000/*",
-            "http://localhost:5173",
-            "http://localhost:5173/*",
-        ],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    # Configure CORS (per environment; skipped when no origins are allowed)
+    if settings.cors_origin_regex:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origin_regex=settings.cors_origin_regex,
+            allow_credentials=True,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
 
     # Mount v1
     app.include_router(get_v1_router())
@@ -78,18 +104,16 @@ def create_app() -> FastAPI:
     # Global Exception Handler
     @app.exception_handler(Exception)
     async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-        logging.error("Unhandled exception occurred:", exc_info=True)
+        logger.exception(
+            "Unhandled exception on %s %s", request.method, request.url.path, exc_info=exc
+        )
         return JSONResponse(
             status_code=500,
             content={"detail": "Internal Server Error"},
         )
 
-    # Optional: a root redirect/info (kept simple)
-    async def root() -> dict[str, str]:
-        return {"service": "fastapi-mongo-starter"}
-
     # register the route explicitly so static analyzers see the function is used
-    app.add_api_route("/", root, methods=["GET"], tags=["meta"])
+    app.add_api_route("/", root, methods=["GET"], tags=["meta"], response_class=ORJSONResponse)
 
     return app
 
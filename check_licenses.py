@@ -9,10 +9,25 @@ async def check():
     """Check licenses."""
     await connect_to_mongodb()
     db = get_database()
-    licenses = await db["corporate_licenses"].find().to_list(10)
-    print(f"Found {len(licenses)} licenses in database")
-
-    for lic in licenses:
+    # Stream each collection straight from the cursor instead of buffering it,
+    # fetching only the fields printed below
+    count = 0
+    async for lic in (
+        db["corporate_licenses"]
+        .find(
+            {},
+            {
+                "corporate_account_id": 1,
+                "course_id": 1,
+                "schedule_id": 1,
+                "total_seats": 1,
+                "status": 1,
+            },
+        )
+        .limit(10)
+        .batch_size(10)
+    ):
+        count += 1
         print(f'\nLicense ID: {lic["_id"]}')
         print(
             f'  Corp Account ID: {lic.get("corporate_account_id")} (type: {type(lic.get("corporate_account_id")).__name__})'
@@ -21,29 +36,38 @@ async def check():
         print(f'  Schedule ID: {lic.get("schedule_id")}')
         print(f'  Total seats: {lic.get("total_seats")}')
         print(f'  Status: {lic.get("status")}')
+    print(f"\nFound {count} licenses in database")
 
     # Check corporate accounts
-    accounts = await db["corporate_accounts"].find().to_list(10)
-    print(f"\n\nFound {len(accounts)} corporate accounts")
-    for acc in accounts:
+    count = 0
+    async for acc in (
+        db["corporate_accounts"]
+        .find({}, {"company_name": 1, "admin_user_ids": 1})
+        .limit(10)
+        .batch_size(10)
+    ):
+        count += 1
         print(f'\nAccount ID: {acc["_id"]}')
         print(f'  Company: {acc.get("company_name")}')
         print(f'  Admin IDs: {acc.get("admin_user_ids")}')
+    print(f"\nFound {count} corporate accounts")
 
     # Get some courses and schedules for testing
-    courses = await db["courses"].find().limit(3).to_list(3)
-    print(f"\n\nFound {len(courses)} courses (showing first 3)")
-    for course in courses:
+    count = 0
+    async for course in db["courses"].find({}, {"title": 1, "cost": 1}).limit(3):
+        count += 1
         print(f'\nCourse ID: {course["_id"]}')
         print(f'  Title: {course.get("title")}')
         print(f'  Cost: ${course.get("cost")}')
+    print(f"\nFound {count} courses (showing first 3)")
 
-    schedules = await db["schedules"].find().limit(3).to_list(3)
-    print(f"\n\nFound {len(schedules)} schedules (showing first 3)")
-    for sched in schedules:
+    count = 0
+    async for sched in db["schedules"].find({}, {"course_id": 1, "start_date": 1}).limit(3):
+        count += 1
         print(f'\nSchedule ID: {sched["_id"]}')
         print(f'  Course ID: {sched.get("course_id")}')
         print(f'  Start Date: {sched.get("start_date")}')
+    print(f"\nFound {count} schedules (showing first 3)")
 
     await close_mongodb_connection()
 
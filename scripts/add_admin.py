@@ -8,9 +8,10 @@ Usage:
 import asyncio
 import sys
 from argparse import ArgumentParser
-from uuid import uuid4
+from datetime import UTC, datetime
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from bson import ObjectId
+from pymongo import AsyncMongoClient
 
 from app.core.config import settings
 from app.core.security import hash_password
@@ -19,7 +20,7 @@ from app.domain.users.value_objects import UserRole
 
 async def add_admin(email: str, name: str, password: str, mongodb_url: str, db_name: str) -> None:
     """Add an admin user to the database."""
-    client = AsyncIOMotorClient(mongodb_url)  # type: ignore[var-annotated]
+    client = AsyncMongoClient(mongodb_url)  # type: ignore[var-annotated]
     db = client[db_name]
 
     try:
@@ -30,17 +31,17 @@ async def add_admin(email: str, name: str, password: str, mongodb_url: str, db_n
             return
 
         # Create admin user document
-        user_id = str(uuid4())
+        user_id = ObjectId()
+        now = datetime.now(UTC)
         admin_user = {
             "_id": user_id,
-            "id": user_id,
             "email": email.lower(),
             "name": name,
             "hashed_password": hash_password(password),
             "role": UserRole.ADMIN,
             "is_active": True,
-            "created_at": {"$date": "2025-11-10T00:00:00Z"},
-            "updated_at": {"$date": "2025-11-10T00:00:00Z"},
+            "created_at": now,
+            "updated_at": now,
         }
 
         # Insert user
@@ -52,7 +53,7 @@ async def add_admin(email: str, name: str, password: str, mongodb_url: str, db_n
         print(f"   Role: {UserRole.ADMIN}")
 
     finally:
-        client.close()
+        await client.close()
 
 
 def main() -> None:
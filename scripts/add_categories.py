@@ -9,11 +9,15 @@ import asyncio
 import sys
 from argparse import ArgumentParser
 from datetime import UTC, datetime
-from uuid import uuid4
+from typing import Any
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError
+from seed_common import seed_write_concern
 
 from app.core.config import settings
+from app.db.course_category_repository import CourseCategoryRepository
 
 
 def utcnow() -> datetime:
@@ -50,54 +54,74 @@ DEFAULT_CATEGORIES = [
 ]
 
 
-async def add_category(name: str, description: str, mongodb_url: str, db_name: str) -> str:
-    """Add a course category to the database."""
-    client = AsyncIOMotorClient(mongodb_url)  # type: ignore[var-annotated]
-    db = client[db_name]
+async def insert_categories(db: AsyncDatabase[Any], categories: list[dict[str, str]]) -> list[str]:
+    """
+    Insert categories with one unordered insert_many call.
 
-    try:
-        # Check if category already exists
-        existing_category = await db.course_categories.find_one(
-            {"name": {"$regex": f"^{name}$", "$options": "i"}}
+    Duplicates are rejected by the unique index on name, so there is no
+    existence check per category.
+
+    Returns:
+        One status message per input category, in input order
+    """
+    now = utcnow()
+    docs: list[dict[str, Any]] = []
+    for category in categories:
+        # _id is left to the driver, which assigns an ObjectId per document
+        docs.append(
+            {
+                "name": category["name"],
+                "description": category["description"],
+                "created_at": now,
+                "updated_at": now,
+            }
         )
-        if existing_category:
-            return f"⏭️  Category '{name}' already exists (ID: {existing_category['_id']})"
-
-        # Create category document
-        category_id = str(uuid4())
-        now = utcnow()
-        category = {
-            "_id": category_id,
-            "id": category_id,
-            "name": name,
-            "description": description,
-            "created_at": now,
-            "updated_at": now,
-        }
-
-        # Insert category
-        await db.course_categories.insert_one(category)
-        return f"✅ Category '{name}' created (ID: {category_id})"
 
-    finally:
-        client.close()
+    errors: dict[int, dict[str, Any]] = {}
+    try:
+        result = await db.course_categories.insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+    else:
+        if not result.acknowledged:
+            return [f"📤 Category '{doc['name']}' sent (unacknowledged)" for doc in docs]
+
+    messages: list[str] = []
+    for index, doc in enumerate(docs):
+        name = doc["name"]
+        error = errors.get(index)
+        if error is None:
+            messages.append(f"✅ Category '{name}' created (ID: {doc['_id']})")
+        elif error["code"] == 11000:
+            messages.append(f"⏭️  Category '{name}' already exists")
+        else:
+            messages.append(f"❌ Error adding category '{name}': {error['errmsg']}")
+    return messages
 
 
 async def add_multiple_categories(
-    categories: list[dict[str, str]], mongodb_url: str, db_name: str
+    categories: list[dict[str, str]], mongodb_url: str, db_name: str, unsafe_writes: bool = False
 ) -> None:
     """Add multiple categories to the database."""
     print(f"📚 Adding {len(categories)} course categories...")
     print(f"   MongoDB URL: {mongodb_url}")
     print(f"   Database: {db_name}\n")
 
-    for category in categories:
-        message = await add_category(
-            name=category["name"],
-            description=category["description"],
-            mongodb_url=mongodb_url,
-            db_name=db_name,
+    client = AsyncMongoClient(  # type: ignore[var-annotated]
+        mongodb_url, maxPoolSize=settings.mongodb_max_pool_size
+    )
+    db = client[db_name]
+
+    try:
+        # The unique name index is what rejects duplicates below
+        await CourseCategoryRepository(db).create_indexes()
+        messages = await insert_categories(
+            db.with_options(write_concern=seed_write_concern(unsafe_writes)), categories
         )
+    finally:
+        await client.close()
+
+    for message in messages:
         print(f"   {message}")
 
     print("\n✨ Done!")
@@ -117,6 +141,12 @@ def main() -> None:
         help="Category description (required if --name is provided)",
     )
 
+    parser.add_argument(
+        "--unsafe-writes",
+        action="store_true",
+        help="Send inserts unacknowledged (w=0); only for throwaway databases",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -127,11 +157,11 @@ def main() -> None:
 
             # Add single category
             asyncio.run(
-                add_category(
-                    name=args.name,
-                    description=args.description,
+                add_multiple_categories(
+                    categories=[{"name": args.name, "description": args.description}],
                     mongodb_url=settings.mongodb_url,
                     db_name=settings.mongodb_db,
+                    unsafe_writes=args.unsafe_writes,
                 )
             )
         else:
@@ -141,6 +171,7 @@ def main() -> None:
                     categories=DEFAULT_CATEGORIES,
                     mongodb_url=settings.mongodb_url,
                     db_name=settings.mongodb_db,
+                    unsafe_writes=args.unsafe_writes,
                 )
             )
     except Exception as e:
@@ -5,21 +5,37 @@ Follows the current database schema for Course, CourseDetails, and SyllabusWeek.
 Usage:
     python scripts/add_courses.py --file courses-2025-11-10.json
     python scripts/add_courses.py --file courses.json --skip-errors
+    python scripts/add_courses.py --file courses.json --rebuild-indexes
 """
 
 import asyncio
 import json
 import sys
 from argparse import ArgumentParser
+from collections.abc import AsyncIterator
+from contextlib import AsyncExitStack, asynccontextmanager
 from datetime import UTC, datetime
 from typing import Any
 
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError
+from seed_common import seed_write_concern
 
 from app.core.config import settings
 from app.domain.courses.course import CourseLevel, CourseStatus
 
+# Documents per insert_many call
+BATCH_SIZE = 1000
+
+# Valid stored values, looked up directly instead of scanning the enums
+_LEVEL_MAP = {level.value: level.value for level in CourseLevel}
+_DEFAULT_LEVEL = CourseLevel.BEGINNER.value
+_STATUS_MAP = {status.value: status.value for status in CourseStatus}
+_DEFAULT_STATUS = CourseStatus.DRAFT.value
+
 
 def utcnow() -> datetime:
     """Get current UTC time."""
@@ -29,33 +45,21 @@ def utcnow() -> datetime:
 def parse_course_level(level_str: str | None) -> str:
     """Parse and validate course level."""
     if not level_str:
-        return CourseLevel.BEGINNER.value
-
-    level_upper = level_str.upper().strip()
-
-    # Try to match against enum values
-    for level in CourseLevel:
-        if level.value == level_upper:
-            return level.value
+        return _DEFAULT_LEVEL
 
-    # Default fallback
-    print(f"   ⚠️  Unknown level '{level_str}', defaulting to BEGINNER")
-    return CourseLevel.BEGINNER.value
+    level = _LEVEL_MAP.get(level_str.upper().strip())
+    if level is None:
+        print(f"   ⚠️  Unknown level '{level_str}', defaulting to BEGINNER")
+        return _DEFAULT_LEVEL
+    return level
 
 
 def parse_course_status(status_str: str | None) -> str:
     """Parse and validate course status."""
     if not status_str:
-        return CourseStatus.DRAFT.value
+        return _DEFAULT_STATUS
 
-    status_upper = status_str.upper().strip()
-
-    # Try to match against enum values
-    for status in CourseStatus:
-        if status.value == status_upper:
-            return status.value
-
-    return CourseStatus.DRAFT.value
+    return _STATUS_MAP.get(status_str.upper().strip(), _DEFAULT_STATUS)
 
 
 def build_course_details(item: dict[str, Any]) -> dict[str, Any]:
@@ -70,85 +74,144 @@ def build_course_details(item: dict[str, Any]) -> dict[str, Any]:
     }
 
 
-async def add_course(
-    course_id: str,
-    item: dict[str, Any],
-    mongodb_url: str,
-    db_name: str,
-    skip_errors: bool = False,
-) -> tuple[bool, str]:
-    """Add a single course to the database."""
-    client = AsyncIOMotorClient(mongodb_url)  # type: ignore[var-annotated]
-    db = client[db_name]
+def build_course_doc(course_id: str, item: dict[str, Any], now: datetime) -> dict[str, Any]:
+    """Build the course document to insert for a JSON item."""
+    # Handle certifications (could be list 'certifications' or string 'certification')
+    certifications = item.get("certifications", [])
+    if not certifications and item.get("certification"):
+        certifications = [item.get("certification")]
+
+    # Build course document
+    course_doc: dict[str, Any] = {
+        "_id": course_id,
+        "id": course_id,
+        "title": item.get("title", f"Course {course_id}"),
+        "description": item.get("description", ""),
+        "duration": item.get("duration", ""),
+        "level": parse_course_level(item.get("level")),
+        "url": item.get("url"),
+        "language": item.get("language"),
+        "image": item.get("image"),
+        "rating": item.get("rating"),
+        "students": item.get("students"),
+        "certifications": certifications,
+        "cost": item.get("cost"),
+        "resources": item.get("resources", []),
+        "notice": item.get("notice"),
+        "tags": item.get("tags", []),
+        "status": parse_course_status(item.get("status")),
+        "courseDetails": build_course_details(item),
+    }
+
+    # Add optional relationship IDs
+    if item.get("vendorId"):
+        course_doc["vendorId"] = item["vendorId"]
+
+    if item.get("categoryId"):
+        course_doc["categoryId"] = item["categoryId"]
+
+    # Handle job roles
+    job_role_ids = item.get("jobRoles") or item.get("jobRoleIds", [])
+    if job_role_ids and isinstance(job_role_ids, list):
+        course_doc["jobRoleIds"] = job_role_ids
+    else:
+        course_doc["jobRoleIds"] = []
+
+    # Add timestamps
+    course_doc["created_at"] = now
+    course_doc["updated_at"] = now
+
+    return course_doc
+
+
+async def insert_course_batch(
+    db: AsyncDatabase[Any], items: list[tuple[str, dict[str, Any]]], now: datetime
+) -> tuple[int, int, int]:
+    """
+    Insert one batch of (course_id, item) pairs and print a line per skip or failure.
+
+    Existing IDs are fetched with a single $in query, the remaining documents
+    are built and sent in one unordered insert_many, and duplicate-key errors
+    (e.g. IDs repeated within the file) count as skipped.
+
+    Returns:
+        Tuple of (added, skipped, failed) counts for the batch
+    """
+    existing = {
+        doc["_id"]
+        async for doc in db.courses.find(
+            {"_id": {"$in": [course_id for course_id, _ in items]}}, {"_id": 1}
+        )
+    }
+
+    skipped = 0
+    failed = 0
+    course_docs: list[dict[str, Any]] = []
+    for course_id, item in items:
+        if course_id in existing:
+            print(f"   ⏭️  Course '{item.get('title', 'Unknown')}' already exists")
+            skipped += 1
+            continue
+
+        try:
+            course_docs.append(build_course_doc(course_id, item, now))
+        except Exception as e:
+            print(f"   ❌ Error adding course '{item.get('title', 'Unknown')}': {str(e)}")
+            failed += 1
+
+    if not course_docs:
+        return 0, skipped, failed
 
     try:
-        # Check if course already exists
-        existing_course = await db.courses.find_one({"_id": course_id})
-        if existing_course:
-            return True, f"⏭️  Course '{item.get('title', 'Unknown')}' already exists"
-
-        # Handle certifications (could be list 'certifications' or string 'certification')
-        certifications = item.get("certifications", [])
-        if not certifications and item.get("certification"):
-            certifications = [item.get("certification")]
-
-        # Build course document
-        course_doc: dict[str, Any] = {
-            "_id": course_id,
-            "id": course_id,
-            "title": item.get("title", f"Course {course_id}"),
-            "description": item.get("description", ""),
-            "duration": item.get("duration", ""),
-            "level": parse_course_level(item.get("level")),
-            "url": item.get("url"),
-            "language": item.get("language"),
-            "image": item.get("image"),
-            "rating": item.get("rating"),
-            "students": item.get("students"),
-            "certifications": certifications,
-            "cost": item.get("cost"),
-            "resources": item.get("resources", []),
-            "notice": item.get("notice"),
-            "tags": item.get("tags", []),
-            "status": parse_course_status(item.get("status")),
-            "courseDetails": build_course_details(item),
-        }
-
-        # Add optional relationship IDs
-        if item.get("vendorId"):
-            course_doc["vendorId"] = item["vendorId"]
-
-        if item.get("categoryId"):
-            course_doc["categoryId"] = item["categoryId"]
-
-        # Handle job roles
-        job_role_ids = item.get("jobRoles") or item.get("jobRoleIds", [])
-        if job_role_ids and isinstance(job_role_ids, list):
-            course_doc["jobRoleIds"] = job_role_ids
-        else:
-            course_doc["jobRoleIds"] = []
-
-        # Add timestamps
-        course_doc["created_at"] = utcnow()
-        course_doc["updated_at"] = utcnow()
-
-        # Insert course
-        await db.courses.insert_one(course_doc)
-        return True, f"✅ Course '{item.get('title', 'Unknown')}' created"
+        result = await db.courses.insert_many(course_docs, ordered=False)
+        return len(result.inserted_ids), skipped, failed
+    except BulkWriteError as e:
+        for error in e.details.get("writeErrors", []):
+            title = course_docs[error["index"]].get("title", "Unknown")
+            if error["code"] == 11000:
+                print(f"   ⏭️  Course '{title}' already exists")
+                skipped += 1
+            else:
+                print(f"   ❌ Error adding course '{title}': {error['errmsg']}")
+                failed += 1
+        return e.details.get("nInserted", 0), skipped, failed
 
-    except Exception as e:
-        error_msg = f"❌ Error adding course '{item.get('title', 'Unknown')}': {str(e)}"
-        if skip_errors:
-            return False, error_msg
-        else:
-            raise
 
+@asynccontextmanager
+async def without_secondary_indexes(collection: AsyncCollection[Any]) -> AsyncIterator[None]:
+    """
+    Drop every index except _id_ for the duration of the block, then rebuild them.
+
+    A large load then skips per-insert index maintenance and each index is
+    rebuilt in one sorted pass. Queries on the collection are slower while
+    the block runs, and a unique index fails to rebuild if the load added
+    duplicates, so only use this for seeding, never against live traffic.
+    """
+    indexes = await collection.index_information()
+    await collection.drop_indexes()
+    print(f"   🗂️  Dropped {len(indexes) - 1} secondary index(es) for the load")
+
+    try:
+        yield
     finally:
-        client.close()
+        for name, info in indexes.items():
+            if name == "_id_":
+                continue
+            options = {k: v for k, v in info.items() if k not in ("key", "v", "ns")}
+            try:
+                await collection.create_index(info["key"], name=name, **options)
+            except Exception as e:
+                print(f"   ❌ Failed to rebuild index '{name}': {e}")
+        print("   🗂️  Rebuilt secondary indexes")
 
 
 async def add_courses_from_json(
-    json_file: str, mongodb_url: str, db_name: str, skip_errors: bool = False
+    json_file: str,
+    mongodb_url: str,
+    db_name: str,
+    skip_errors: bool = False,
+    rebuild_indexes: bool = False,
+    unsafe_writes: bool = False,
 ) -> None:
     """Add courses from a JSON file."""
     try:
@@ -169,51 +232,50 @@ async def add_courses_from_json(
     print(f"   MongoDB URL: {mongodb_url}")
     print(f"   Database: {db_name}\n")
 
-    successful = 0
     skipped = 0
     failed = 0
 
+    # Use provided ID or generate one
+    items: list[tuple[str, dict[str, Any]]] = []
     for idx, item in enumerate(data, 1):
         if not isinstance(item, dict):
             print(f"   ⏭️  Skipping item {idx}: Not a valid course object")
             skipped += 1
             continue
+        items.append((item.get("id", str(ObjectId())), item))
 
-        # Use provided ID or generate one
-        course_id = item.get("id", str(ObjectId()))
-
-        try:
-            success, message = await add_course(
-                course_id=course_id,
-                item=item,
-                mongodb_url=mongodb_url,
-                db_name=db_name,
-                skip_errors=skip_errors,
-            )
-
-            print(f"   [{idx}/{len(data)}] {message}")
-
-            if success:
-                if "already exists" in message:
-                    skipped += 1
-                else:
-                    successful += 1
-            else:
-                failed += 1
-
-        except Exception as e:
-            print(f"   [{idx}/{len(data)}] ❌ Error: {str(e)}")
-            failed += 1
+    client = AsyncMongoClient(  # type: ignore[var-annotated]
+        mongodb_url, maxPoolSize=settings.mongodb_max_pool_size
+    )
+    db = client[db_name]
+    seed_db = db.with_options(write_concern=seed_write_concern(unsafe_writes))
 
-            if not skip_errors:
-                print(f"\n❌ Failed at course {idx}. Use --skip-errors to continue.")
-                sys.exit(1)
+    successful = 0
+    now = utcnow()
+    try:
+        async with AsyncExitStack() as stack:
+            if rebuild_indexes:
+                await stack.enter_async_context(without_secondary_indexes(db.courses))
+
+            # Documents are built and inserted one batch at a time, so only a
+            # batch of built documents (and its $in list) is held at once
+            for start in range(0, len(items), BATCH_SIZE):
+                added, batch_skipped, batch_failed = await insert_course_batch(
+                    seed_db, items[start : start + BATCH_SIZE], now
+                )
+                successful += added
+                skipped += batch_skipped
+                failed += batch_failed
+    finally:
+        await client.close()
 
     print("\n✨ Summary:")
     print(f"   ✅ Added: {successful}")
     print(f"   ⏭️  Skipped: {skipped}")
     print(f"   ❌ Failed: {failed}")
     print(f"   📊 Total: {successful + skipped + failed}/{len(data)}")
+    if unsafe_writes:
+        print("   ⚠️  Writes were unacknowledged; 'Added' counts documents sent")
 
     if failed > 0 and not skip_errors:
         sys.exit(1)
@@ -233,6 +295,20 @@ def main() -> None:
         action="store_true",
         help="Continue on errors instead of stopping",
     )
+    parser.add_argument(
+        "--rebuild-indexes",
+        action="store_true",
+        help=(
+            "Drop secondary course indexes during the load and rebuild them afterwards "
+            "(faster for large seeds; queries are slow meanwhile)"
+        ),
+    )
+
+    parser.add_argument(
+        "--unsafe-writes",
+        action="store_true",
+        help="Send inserts unacknowledged (w=0); only for throwaway databases",
+    )
 
     args = parser.parse_args()
 
@@ -243,6 +319,8 @@ def main() -> None:
                 mongodb_url=settings.mongodb_url,
                 db_name=settings.mongodb_db,
                 skip_errors=args.skip_errors,
+                rebuild_indexes=args.rebuild_indexes,
+                unsafe_writes=args.unsafe_writes,
             )
         )
     except Exception as e:
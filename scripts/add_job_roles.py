@@ -9,11 +9,15 @@ import asyncio
 import sys
 from argparse import ArgumentParser
 from datetime import UTC, datetime
-from uuid import uuid4
+from typing import Any
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError
+from seed_common import seed_write_concern
 
 from app.core.config import settings
+from app.db.job_role_repository import JobRoleRepository
 
 
 def utcnow() -> datetime:
@@ -66,54 +70,74 @@ DEFAULT_JOB_ROLES = [
 ]
 
 
-async def add_job_role(name: str, description: str, mongodb_url: str, db_name: str) -> str:
-    """Add a job role to the database."""
-    client = AsyncIOMotorClient(mongodb_url)  # type: ignore[var-annotated]
-    db = client[db_name]
+async def insert_job_roles(db: AsyncDatabase[Any], job_roles: list[dict[str, str]]) -> list[str]:
+    """
+    Insert job_roles with one unordered insert_many call.
 
-    try:
-        # Check if job role already exists
-        existing_role = await db.job_roles.find_one(
-            {"name": {"$regex": f"^{name}$", "$options": "i"}}
+    Duplicates are rejected by the unique index on name, so there is no
+    existence check per role.
+
+    Returns:
+        One status message per input role, in input order
+    """
+    now = utcnow()
+    docs: list[dict[str, Any]] = []
+    for role in job_roles:
+        # _id is left to the driver, which assigns an ObjectId per document
+        docs.append(
+            {
+                "name": role["name"],
+                "description": role["description"],
+                "created_at": now,
+                "updated_at": now,
+            }
         )
-        if existing_role:
-            return f"⏭️  Job role '{name}' already exists (ID: {existing_role['_id']})"
-
-        # Create job role document
-        role_id = str(uuid4())
-        now = utcnow()
-        job_role = {
-            "_id": role_id,
-            "id": role_id,
-            "name": name,
-            "description": description,
-            "created_at": now,
-            "updated_at": now,
-        }
-
-        # Insert job role
-        await db.job_roles.insert_one(job_role)
-        return f"✅ Job role '{name}' created (ID: {role_id})"
 
-    finally:
-        client.close()
+    errors: dict[int, dict[str, Any]] = {}
+    try:
+        result = await db.job_roles.insert_many(docs, ordered=False)
+    except BulkWriteError as e:
+        errors = {error["index"]: error for error in e.details.get("writeErrors", [])}
+    else:
+        if not result.acknowledged:
+            return [f"📤 Job role '{doc['name']}' sent (unacknowledged)" for doc in docs]
+
+    messages: list[str] = []
+    for index, doc in enumerate(docs):
+        name = doc["name"]
+        error = errors.get(index)
+        if error is None:
+            messages.append(f"✅ Job role '{name}' created (ID: {doc['_id']})")
+        elif error["code"] == 11000:
+            messages.append(f"⏭️  Job role '{name}' already exists")
+        else:
+            messages.append(f"❌ Error adding job role '{name}': {error['errmsg']}")
+    return messages
 
 
 async def add_multiple_job_roles(
-    job_roles: list[dict[str, str]], mongodb_url: str, db_name: str
+    job_roles: list[dict[str, str]], mongodb_url: str, db_name: str, unsafe_writes: bool = False
 ) -> None:
     """Add multiple job roles to the database."""
     print(f"💼 Adding {len(job_roles)} job roles...")
     print(f"   MongoDB URL: {mongodb_url}")
     print(f"   Database: {db_name}\n")
 
-    for role in job_roles:
-        message = await add_job_role(
-            name=role["name"],
-            description=role["description"],
-            mongodb_url=mongodb_url,
-            db_name=db_name,
+    client = AsyncMongoClient(  # type: ignore[var-annotated]
+        mongodb_url, maxPoolSize=settings.mongodb_max_pool_size
+    )
+    db = client[db_name]
+
+    try:
+        # The unique name index is what rejects duplicates below
+        await JobRoleRepository(db).create_indexes()
+        messages = await insert_job_roles(
+            db.with_options(write_concern=seed_write_concern(unsafe_writes)), job_roles
         )
+    finally:
+        await client.close()
+
+    for message in messages:
         print(f"   {message}")
 
     print("\n✨ Done!")
@@ -133,6 +157,12 @@ def main() -> None:
         help="Job role description (required if --name is provided)",
     )
 
+    parser.add_argument(
+        "--unsafe-writes",
+        action="store_true",
+        help="Send inserts unacknowledged (w=0); only for throwaway databases",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -143,11 +173,11 @@ def main() -> None:
 
             # Add single job role
             asyncio.run(
-                add_job_role(
-                    name=args.name,
-                    description=args.description,
+                add_multiple_job_roles(
+                    job_roles=[{"name": args.name, "description": args.description}],
                     mongodb_url=settings.mongodb_url,
                     db_name=settings.mongodb_db,
+                    unsafe_writes=args.unsafe_writes,
                 )
             )
         else:
@@ -157,6 +187,7 @@ def main() -> None:
                     job_roles=DEFAULT_JOB_ROLES,
                     mongodb_url=settings.mongodb_url,
                     db_name=settings.mongodb_db,
+                    unsafe_writes=args.unsafe_writes,
                 )
             )
     except Exception as e:
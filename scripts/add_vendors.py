@@ -10,57 +10,103 @@ import asyncio
 import json
 import sys
 from argparse import ArgumentParser
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from typing import Any
 
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient, UpdateOne
+from pymongo.errors import BulkWriteError
+from seed_common import seed_write_concern
 
 from app.core.config import settings
 
+# (vendor_id, {"name", "description", "logo"}) as read from the CLI or a course file
+VendorEntry = tuple[str, dict[str, str | None]]
+
 
 def utcnow() -> datetime:
     """Get current UTC time."""
     return datetime.now(UTC)
 
 
-async def add_vendor(
-    vendor_id: str,
-    name: str | None,
-    description: str | None,
-    logo: str | None,
-    mongodb_url: str,
-    db_name: str,
-) -> str:
-    """Add a vendor to the database with a specific ID."""
-    client = AsyncIOMotorClient(mongodb_url)  # type: ignore[var-annotated]
-    db = client[db_name]
+def vendor_upsert(vendor_id: str, vendor_data: dict[str, str | None], now: datetime) -> UpdateOne:
+    """Build an upsert that creates the vendor only if its ID does not exist yet."""
+    name = vendor_data["name"]
+    return UpdateOne(
+        {"_id": vendor_id},
+        {
+            "$setOnInsert": {
+                "id": vendor_id,
+                "name": name or "Unknown",
+                "description": vendor_data["description"] or "",
+                "logo": vendor_data["logo"],
+                "created_at": now,
+                "updated_at": now,
+            }
+        },
+        upsert=True,
+    )
 
-    try:
-        # Check if vendor already exists
-        existing_vendor = await db.vendors.find_one({"_id": vendor_id})
-        if existing_vendor:
-            return f"⏭️  Vendor '{name}' already exists (ID: {vendor_id})"
-
-        # Create vendor document
-        now = utcnow()
-        vendor = {
-            "_id": vendor_id,
-            "id": vendor_id,
-            "name": name or "Unknown",
-            "description": description or "",
-            "logo": logo,
-            "created_at": now,
-            "updated_at": now,
+
+def iter_vendors(data: list[dict[str, Any]]) -> Iterator[VendorEntry]:
+    """Yield (vendor_id, vendor_data) for each distinct vendor ID in course items."""
+    seen: set[str] = set()
+    for item in data:
+        vendor = item.get("vendor") or {}
+        vendor_id = vendor.get("id")
+        if not vendor_id or vendor_id in seen:
+            continue
+        seen.add(vendor_id)
+        yield vendor_id, {
+            "name": vendor.get("name", "Unknown"),
+            "description": vendor.get("description", ""),
+            "logo": vendor.get("logo"),
         }
 
-        # Insert vendor
-        await db.vendors.insert_one(vendor)
-        return f"✅ Vendor '{name}' created (ID: {vendor_id})"
 
+async def add_vendors(
+    vendors: list[VendorEntry], mongodb_url: str, db_name: str, unsafe_writes: bool = False
+) -> None:
+    """
+    Add (vendor_id, vendor_data) pairs in a single unordered bulk write.
+
+    Each vendor is an upsert with $setOnInsert, so existing vendors are left
+    untouched and the existence check costs no extra round trip.
+    """
+    now = utcnow()
+    operations = [vendor_upsert(vendor_id, vendor_data, now) for vendor_id, vendor_data in vendors]
+
+    client = AsyncMongoClient(  # type: ignore[var-annotated]
+        mongodb_url, maxPoolSize=settings.mongodb_max_pool_size
+    )
+    db = client.get_database(db_name, write_concern=seed_write_concern(unsafe_writes))
+
+    errors: dict[int, str] = {}
+    try:
+        result = await db.vendors.bulk_write(operations, ordered=False)
+        if not result.acknowledged:
+            print(f"   📤 Sent {len(operations)} vendor upsert(s) (unacknowledged)")
+            return
+        created = set(result.upserted_ids or ())
+    except BulkWriteError as e:
+        created = {upsert["index"] for upsert in e.details.get("upserted", [])}
+        errors = {error["index"]: error["errmsg"] for error in e.details.get("writeErrors", [])}
     finally:
-        client.close()
+        await client.close()
+
+    for index, (vendor_id, vendor_data) in enumerate(vendors):
+        name = vendor_data["name"]
+        if index in errors:
+            print(f"   ❌ Error adding vendor '{name}' (ID: {vendor_id}): {errors[index]}")
+        elif index in created:
+            print(f"   ✅ Vendor '{name}' created (ID: {vendor_id})")
+        else:
+            print(f"   ⏭️  Vendor '{name}' already exists (ID: {vendor_id})")
 
 
-async def add_vendors_from_json(json_file: str, mongodb_url: str, db_name: str) -> None:
+async def add_vendors_from_json(
+    json_file: str, mongodb_url: str, db_name: str, unsafe_writes: bool = False
+) -> None:
     """Add vendors from a JSON file."""
     try:
         with open(json_file) as f:
@@ -72,37 +118,18 @@ async def add_vendors_from_json(json_file: str, mongodb_url: str, db_name: str)
         print(f"❌ Error: Invalid JSON in '{json_file}'")
         sys.exit(1)
 
-    # Extract unique vendors
-    vendors_dict: dict[str, dict[str, str | None]] = {}
-    for item in data:
-        if "vendor" in item:
-            vendor = item["vendor"]
-            vendor_id = vendor.get("id")
-            if vendor_id and vendor_id not in vendors_dict:
-                vendors_dict[vendor_id] = {
-                    "name": vendor.get("name", "Unknown"),
-                    "description": vendor.get("description", ""),
-                    "logo": vendor.get("logo"),
-                }
-
-    if not vendors_dict:
+    vendors = list(iter_vendors(data))
+    if not vendors:
         print("⚠️  No vendors found in JSON file")
         return
 
-    print(f"🏢 Adding {len(vendors_dict)} vendors from '{json_file}'...")
+    print(f"🏢 Adding {len(vendors)} vendors from '{json_file}'...")
     print(f"   MongoDB URL: {mongodb_url}")
     print(f"   Database: {db_name}\n")
 
-    for vendor_id, vendor_data in vendors_dict.items():
-        message = await add_vendor(
-            vendor_id=vendor_id,
-            name=vendor_data["name"],
-            description=vendor_data["description"],
-            logo=vendor_data["logo"],
-            mongodb_url=mongodb_url,
-            db_name=db_name,
-        )
-        print(f"   {message}")
+    await add_vendors(
+        vendors, mongodb_url=mongodb_url, db_name=db_name, unsafe_writes=unsafe_writes
+    )
 
     print("\n✨ Done!")
 
@@ -136,6 +163,12 @@ def main() -> None:
         help="Vendor logo URL (optional)",
     )
 
+    parser.add_argument(
+        "--unsafe-writes",
+        action="store_true",
+        help="Send inserts unacknowledged (w=0); only for throwaway databases",
+    )
+
     args = parser.parse_args()
 
     try:
@@ -146,21 +179,28 @@ def main() -> None:
                     json_file=args.file,
                     mongodb_url=settings.mongodb_url,
                     db_name=settings.mongodb_db,
+                    unsafe_writes=args.unsafe_writes,
                 )
             )
         elif args.id and args.name:
             # Add single vendor with specific ID
-            message = asyncio.run(
-                add_vendor(
-                    vendor_id=args.id,
-                    name=args.name,
-                    description=args.description or "",
-                    logo=args.logo,
+            asyncio.run(
+                add_vendors(
+                    [
+                        (
+                            args.id,
+                            {
+                                "name": args.name,
+                                "description": args.description or "",
+                                "logo": args.logo,
+                            },
+                        )
+                    ],
                     mongodb_url=settings.mongodb_url,
                     db_name=settings.mongodb_db,
+                    unsafe_writes=args.unsafe_writes,
                 )
             )
-            print(message)
         else:
             print("❌ Error: Provide either --file or both --id and --name")
             parser.print_help()
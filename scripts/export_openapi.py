@@ -3,56 +3,86 @@ Script to export the OpenAPI schema to a JSON file.
 Usage:
     python scripts/export_openapi.py
     python scripts/export_openapi.py --domain auth
+    python scripts/export_openapi.py --domain all
+    python scripts/export_openapi.py --compact
 """
 
 import argparse
-import json
+import importlib
 import sys
 from pathlib import Path
+from typing import Any
 
-from fastapi import FastAPI
+import orjson
+from fastapi import APIRouter, FastAPI
 
 # Add the project root to the python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from app.api.v1.routers import (
-    analytics_router,
-    assignments_router,
-    auth_router,
-    certifications_router,
-    contact_forms_router,
-    course_categories_router,
-    courses_router,
-    enrollments_router,
-    job_roles_router,
-    ping_router,
-    schedules_router,
-    submissions_router,
-    users_router,
-    vendors_router,
-)
-from app.main import create_app
-
+# Domain name -> module under app.api.v1.routers; imported only when exported
 DOMAIN_ROUTERS = {
-    "analytics": analytics_router,
-    "assignments": assignments_router,
-    "auth": auth_router,
-    "certifications": certifications_router,
-    "contact-forms": contact_forms_router,
-    "courses": courses_router,
-    "course-categories": course_categories_router,
-    "job-roles": job_roles_router,
-    "ping": ping_router,
-    "submissions": submissions_router,
-    "users": users_router,
-    "vendors": vendors_router,
-    "schedules": schedules_router,
-    "enrollments": enrollments_router,
+    "analytics": "analytics",
+    "assignments": "assignments",
+    "auth": "auth",
+    "certifications": "certifications",
+    "contact-forms": "contact_forms",
+    "courses": "courses",
+    "course-categories": "course_categories",
+    "job-roles": "job_roles",
+    "ping": "ping",
+    "submissions": "submissions",
+    "users": "users",
+    "vendors": "vendors",
+    "schedules": "schedules",
+    "enrollments": "enrollments",
 }
 
 
-def export_openapi(domain: str | None = None) -> None:
-    """Export the OpenAPI schema."""
+def load_router(domain: str) -> APIRouter:
+    """Import and return the router for a single domain."""
+    module = importlib.import_module(f"app.api.v1.routers.{DOMAIN_ROUTERS[domain]}")
+    router: APIRouter = module.router
+    return router
+
+
+def write_schema(openapi_data: dict[str, Any], output_filename: str, compact: bool) -> None:
+    """Write a schema to output_filename, indented unless compact is set."""
+    output_path = Path(output_filename)
+    output_path.write_bytes(
+        orjson.dumps(openapi_data, option=0 if compact else orjson.OPT_INDENT_2)
+    )
+    print(f"Successfully exported OpenAPI schema to {output_path.absolute()}")
+
+
+def export_all_domains(compact: bool = False) -> None:
+    """
+    Export every domain from a single schema build.
+
+    The full app's schema is generated once and its paths are split per
+    domain router; each file shares the full app's components section.
+    """
+    from app.main import create_app
+
+    schema = create_app().openapi()
+
+    for domain in DOMAIN_ROUTERS:
+        router = load_router(domain)
+        domain_paths = {f"/api/v1{route.path}" for route in router.routes}  # type: ignore[attr-defined]
+        subset = {
+            "openapi": schema["openapi"],
+            "info": {**schema["info"], "title": f"FastAPI - {domain}"},
+            "paths": {path: ops for path, ops in schema["paths"].items() if path in domain_paths},
+            "components": schema.get("components", {}),
+        }
+        write_schema(subset, f"openapi_{domain}.json", compact)
+
+
+def export_openapi(domain: str | None = None, compact: bool = False) -> None:
+    """Export the OpenAPI schema, indented unless compact is set."""
+    if domain == "all":
+        export_all_domains(compact)
+        return
+
     if domain:
         if domain not in DOMAIN_ROUTERS:
             print(
@@ -62,29 +92,26 @@ def export_openapi(domain: str | None = None) -> None:
 
         # Create a minimal app for just this domain
         app = FastAPI(title=f"FastAPI - {domain}")
-        app.include_router(DOMAIN_ROUTERS[domain], prefix="/api/v1")
+        app.include_router(load_router(domain), prefix="/api/v1")
         output_filename = f"openapi_{domain}.json"
     else:
         # Export full app
+        from app.main import create_app
+
         app = create_app()
         output_filename = "openapi.json"
 
-    # Get the schema
-    openapi_data = app.openapi()
-
-    # Define output path
-    output_path = Path(output_filename)
-
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(openapi_data, f, indent=2)
-
-    print(f"Successfully exported OpenAPI schema to {output_path.absolute()}")
+    write_schema(app.openapi(), output_filename, compact)
 
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Export OpenAPI schema")
-    parser.add_argument("--domain", help="Specific domain to export (e.g., auth, courses)")
+    parser.add_argument(
+        "--domain", help="Domain to export (e.g., auth, courses), or 'all' for one file per domain"
+    )
+    parser.add_argument(
+        "--compact", action="store_true", help="Write minified JSON (e.g. for CI diffs)"
+    )
     args = parser.parse_args()
 
-    export_openapi(args.domain)
+    export_openapi(args.domain, compact=args.compact)
@@ -0,0 +1,75 @@
+"""Script to replace plaintext passwords in the users seed file with argon2 hashes.
+
+seed_db.py stores a precomputed hashed_password as is and only hashes a
+plaintext "password" field as a fallback, so run this after adding users to
+the seed file to keep seeding free of hashing work.
+
+Usage:
+    python scripts/hash_seed_passwords.py
+    python scripts/hash_seed_passwords.py --file seed/users.json
+"""
+
+import json
+import os
+import sys
+from argparse import ArgumentParser
+
+# Add project root to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.security import hash_password
+
+DEFAULT_FILE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "seed", "users.json"
+)
+
+
+def hash_seed_passwords(file_path: str) -> int:
+    """
+    Hash every plaintext password in file_path in place.
+
+    Returns:
+        Number of passwords hashed
+    """
+    with open(file_path, encoding="utf-8") as f:
+        users = json.load(f)
+
+    hashed = 0
+    for user in users:
+        if "password" in user:
+            user["hashed_password"] = hash_password(user.pop("password"))
+            hashed += 1
+
+    if hashed:
+        with open(file_path, "w", encoding="utf-8") as f:
+            json.dump(users, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+
+    return hashed
+
+
+def main() -> None:
+    """Main entry point."""
+    parser = ArgumentParser(description="Hash plaintext passwords in the users seed file")
+    parser.add_argument(
+        "--file",
+        type=str,
+        default=DEFAULT_FILE,
+        help="Users seed file to rewrite (default: seed/users.json)",
+    )
+    args = parser.parse_args()
+
+    try:
+        hashed = hash_seed_passwords(args.file)
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+    if hashed:
+        print(f"✅ Hashed {hashed} password(s) in {args.file}")
+    else:
+        print(f"⏭️  No plaintext passwords in {args.file}")
+
+
+if __name__ == "__main__":
+    main()
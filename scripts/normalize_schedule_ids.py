@@ -0,0 +1,53 @@
+"""Script to convert legacy string course_id/tutor_id values on schedules to ObjectId.
+
+Schedule queries match references as ObjectId only, so run this once against
+any database that still holds schedules written with string references.
+
+Usage:
+    python scripts/normalize_schedule_ids.py
+"""
+
+import asyncio
+import sys
+
+from pymongo import AsyncMongoClient
+
+from app.core.config import settings
+from app.db.mongo import CODEC_OPTIONS, mongo_client_options
+from app.db.schedule_repository import ScheduleRepository
+
+
+async def normalize_schedule_ids(mongodb_url: str, db_name: str) -> None:
+    """Rewrite string references and make sure the compound indexes exist."""
+    # Same connection options as the app, including the CA bundle for remote hosts
+    client = AsyncMongoClient(  # type: ignore[var-annotated]
+        mongodb_url, **mongo_client_options(mongodb_url)
+    )
+
+    try:
+        repo = ScheduleRepository(client.get_database(db_name, codec_options=CODEC_OPTIONS))
+        modified = await repo.normalize_reference_ids()
+        print(f"✅ Normalized references on {modified} schedule field(s)")
+
+        await repo.create_indexes()
+        print("✅ Schedule indexes ensured")
+
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    """Main entry point."""
+    print("🔧 Normalizing schedule reference IDs...")
+    print(f"   MongoDB URL: {settings.mongodb_url}")
+    print(f"   Database: {settings.mongodb_db}")
+
+    try:
+        asyncio.run(normalize_schedule_ids(settings.mongodb_url, settings.mongodb_db))
+    except Exception as e:
+        print(f"❌ Error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
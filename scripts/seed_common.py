@@ -0,0 +1,19 @@
+"""Helpers shared by the add_* seed scripts; not a script itself.
+
+The scripts import this module as a sibling, which works because Python puts
+the script's directory on sys.path when running `python scripts/<name>.py`.
+"""
+
+from pymongo import WriteConcern
+
+
+def seed_write_concern(unsafe_writes: bool) -> WriteConcern:
+    """
+    Write concern for seed inserts.
+
+    w=1 (primary acknowledgement only) skips waiting on a replica-set
+    majority; seeding is idempotent, so a lost write is fixed by re-running.
+    --unsafe-writes goes further with w=0, where nothing is acknowledged and
+    per-item results cannot be reported.
+    """
+    return WriteConcern(w=0 if unsafe_writes else 1)
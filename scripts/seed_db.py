@@ -3,17 +3,26 @@ Unified script to seed and verify MongoDB collections.
 
 Usage:
     python scripts/seed_db.py
+
+The users in seed/users.json log in with "password123". Their hashes are
+precomputed with scripts/hash_seed_passwords.py; any plaintext "password"
+left in the file is hashed here with the configured argon2 cost (for a
+throwaway local database, ARGON2_TIME_COST=1 ARGON2_MEMORY_COST=1024 makes
+this fast).
 """
 
 import asyncio
-import json
 import os
 import sys
+from collections.abc import Callable
 from datetime import UTC, datetime
 from typing import Any
 
+import orjson
 from bson import ObjectId
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.errors import BulkWriteError
 
 # Add project root to path to import app modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,25 +30,24 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from app.core.config import settings
 from app.core.security import hash_password
 
-# Map collection names to seed files and ID fields
+# Map collection names to seed files and the fields converted before insert
 COLLECTIONS = [
-    {"name": "users", "file": "users.json", "key": "email"},
-    {"name": "vendors", "file": "vendors.json", "key": "name"},
-    {"name": "certifications", "file": "certifications.json", "key": "_id"},
-    {"name": "job_roles", "file": "job_roles.json", "key": "name"},
-    {"name": "course_categories", "file": "course_categories.json", "key": "name"},
-    {"name": "courses", "file": "courses.json", "key": "title"},
-    {"name": "contact-forms", "file": "contact_forms.json", "key": "_id"},
+    {"name": "users", "file": "users.json"},
+    {"name": "vendors", "file": "vendors.json"},
+    {"name": "certifications", "file": "certifications.json"},
+    {"name": "job_roles", "file": "job_roles.json"},
+    {"name": "course_categories", "file": "course_categories.json"},
+    {"name": "courses", "file": "courses.json"},
+    {"name": "contact-forms", "file": "contact_forms.json"},
     {
         "name": "schedules",
         "file": "schedules.json",
-        "key": "_id",
         "date_fields": ["start_date", "end_date"],
+        "object_id_fields": ["course_id", "tutor_id"],
     },
     {
         "name": "enrollments",
         "file": "enrollments.json",
-        "key": "_id",
         "date_fields": ["created_at", "paid_at", "enrolled_at", "completed_at"],
         "nested_date_fields": [("instructor_notes", "date")],
     },
@@ -48,30 +56,87 @@ COLLECTIONS = [
 SEED_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "seed")
 
 
-async def seed_collection(db: AsyncIOMotorDatabase[Any], collection_info: dict[str, Any]) -> int:
-    """Seed a single collection."""
+def parse_iso_date(value: Any) -> Any:
+    """Parse an ISO format date string, returning anything else unchanged."""
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return value
+
+
+def make_preprocessor(
+    collection_info: dict[str, Any], now: datetime
+) -> Callable[[dict[str, Any]], None]:
+    """
+    Build the in-place item conversion for one collection.
+
+    The collection's field lists are read once here rather than per item,
+    and now fills any missing created_at/updated_at.
+    """
+    date_fields: tuple[str, ...] = tuple(collection_info.get("date_fields", ()))
+    nested_date_fields: tuple[tuple[str, str], ...] = tuple(
+        collection_info.get("nested_date_fields", ())
+    )
+    object_id_fields: tuple[str, ...] = tuple(collection_info.get("object_id_fields", ()))
+
+    def prepare(item: dict[str, Any]) -> None:
+        # Convert _id to ObjectId if valid; otherwise keep the string
+        if ObjectId.is_valid(item.get("_id")):
+            item["_id"] = ObjectId(item["_id"])
+
+        # Convert reference fields stored as ObjectId by the app
+        for field in object_id_fields:
+            if ObjectId.is_valid(item.get(field)):
+                item[field] = ObjectId(item[field])
+
+        for field in date_fields:
+            if item.get(field):
+                item[field] = parse_iso_date(item[field])
+
+        # Parse nested date fields (e.g., instructor_notes[].date)
+        for list_field, date_key in nested_date_fields:
+            nested_items = item.get(list_field)
+            if isinstance(nested_items, list):
+                for nested_item in nested_items:
+                    if isinstance(nested_item, dict) and date_key in nested_item:
+                        nested_item[date_key] = parse_iso_date(nested_item[date_key])
+
+        # Add timestamps if missing
+        item.setdefault("created_at", now)
+        item.setdefault("updated_at", now)
+
+    return prepare
+
+
+async def seed_collection(
+    db: AsyncDatabase[Any], collection_info: dict[str, Any]
+) -> tuple[int, int]:
+    """
+    Seed a single collection.
+
+    Returns:
+        Tuple of (items in the seed file, documents inserted)
+    """
     collection_name = collection_info["name"]
     file_name = collection_info["file"]
-    key_field = collection_info["key"]
-    date_fields: list[str] = collection_info.get("date_fields", [])
-    nested_date_fields: list[tuple[str, str]] = collection_info.get("nested_date_fields", [])
-
     file_path = os.path.join(SEED_DIR, file_name)
 
     if not os.path.exists(file_path):
         print(f"⚠️  File not found: {file_name}. Skipping.")
-        return 0
+        return 0, 0
 
     try:
-        with open(file_path, encoding="utf-8") as f:
-            data = json.load(f)
+        with open(file_path, "rb") as f:
+            data = orjson.loads(f.read())
     except Exception as e:
         print(f"❌ Error reading {file_name}: {e}")
-        return 0
+        return 0, 0
 
     if not isinstance(data, list):
         print(f"❌ Invalid format in {file_name}: Expected a list.")
-        return 0
+        return 0, 0
 
     collection = db[collection_name]
     added_count = 0
@@ -82,76 +147,41 @@ async def seed_collection(db: AsyncIOMotorDatabase[Any], collection_info: dict[s
     print(f"   🧹 Clearing existing data from {collection_name}...")
     await collection.delete_many({})
 
+    # One timestamp for the whole collection's missing created_at/updated_at
+    now = datetime.now(UTC)
+
+    # Fallback for plaintext passwords not yet run through hash_seed_passwords.py.
+    # Argon2 is CPU-bound but releases the GIL; hash them concurrently off the loop
+    if collection_name == "users":
+        users = [item for item in data if "password" in item]
+        hashes = await asyncio.gather(
+            *(asyncio.to_thread(hash_password, item.pop("password")) for item in users)
+        )
+        for item, hashed in zip(users, hashes, strict=True):
+            item["hashed_password"] = hashed
+
+    prepare = make_preprocessor(collection_info, now)
     for item in data:
-        # Convert _id to ObjectId if present
-        if "_id" in item:
-            try:
-                item["_id"] = ObjectId(item["_id"])
-            except Exception:
-                pass  # Keep as string if not valid ObjectId, though typically it should be
-
-        # Hash password for users collection
-        if collection_name == "users" and "password" in item:
-            item["hashed_password"] = hash_password(item.pop("password"))
-
-        # Parse date fields
-        for field in date_fields:
-            if field in item and item[field]:
-                try:
-                    # Handle ISO format strings
-                    if isinstance(item[field], str):
-                        item[field] = datetime.fromisoformat(item[field])
-                except ValueError:
-                    pass
+        prepare(item)
 
-        # Parse nested date fields (e.g., instructor_notes[].date)
-        for list_field, date_key in nested_date_fields:
-            if list_field in item and isinstance(item[list_field], list):
-                for nested_item in item[list_field]:
-                    if isinstance(nested_item, dict) and date_key in nested_item:
-                        if isinstance(nested_item[date_key], str):
-                            try:
-                                nested_item[date_key] = datetime.fromisoformat(
-                                    nested_item[date_key]
-                                )
-                            except ValueError:
-                                pass
+    # The collection was just cleared, so every item is new: one unordered insert_many
+    if data:
+        try:
+            result = await collection.insert_many(data, ordered=False)
+            added_count = len(result.inserted_ids)
+        except BulkWriteError as e:
+            added_count = e.details.get("nInserted", 0)
+            for error in e.details.get("writeErrors", []):
+                print(
+                    f"   ❌ Error inserting {collection_name} item {error['index']}: {error['errmsg']}"
+                )
 
-        # Add timestamps if missing
-        now = datetime.now(UTC)
-        if "created_at" not in item:
-            item["created_at"] = now
-        if "updated_at" not in item:
-            item["updated_at"] = now
-
-        # Check existence
-        query = {}
-        if key_field == "_id":
-            query = {"_id": item["_id"]}
-        else:
-            query = {key_field: item.get(key_field)}
-
-        existing = await collection.find_one(query)
-
-        if existing:
-            # Optional: Update existing? For now, just skip or maybe update if needed.
-            # Let's skip to avoid overwriting user changes, or we could upsert.
-            # For seed data, upserting is often better to ensure state.
-            # But let's stick to "skip if exists" to be safe, or maybe replace?
-            # Let's use replace_one with upsert=True to ensure the seed state matches.
-            await collection.replace_one({"_id": item["_id"]}, item, upsert=True)
-            # print(f"   Updated/Verified {item.get(key_field)}")
-        else:
-            await collection.insert_one(item)
-            added_count += 1
-            # print(f"   Added {item.get(key_field)}")
-
-    print(f"   ✅ Processed {len(data)} items for {collection_name}.")
-    return len(data)
+    print(f"   ✅ Processed {len(data)} items for {collection_name} ({added_count} added).")
+    return len(data), added_count
 
 
 async def verify_collection(
-    db: AsyncIOMotorDatabase[Any], collection_info: dict[str, Any], expected_count: int
+    db: AsyncDatabase[Any], collection_info: dict[str, Any], expected_count: int
 ) -> bool:
     """Verify collection count."""
     collection_name = collection_info["name"]
@@ -171,25 +201,39 @@ async def verify_collection(
         return False
 
 
+async def seed_and_verify(db: AsyncDatabase[Any], collection_info: dict[str, Any]) -> None:
+    """Seed a collection and then verify its count."""
+    expected_count, added_count = await seed_collection(db, collection_info)
+
+    # The collection was cleared first, so an acknowledged insert of every item
+    # already proves the count; only query the server when something is missing
+    if added_count == expected_count:
+        print(f"🧐 Verified {collection_info['name']}: inserted all {expected_count} documents")
+        return
+
+    await verify_collection(db, collection_info, expected_count)
+
+
 async def main() -> None:
     print("🚀 Starting database seed and verification...")
     print(f"   Database: {settings.mongodb_db}")
 
-    client: AsyncIOMotorClient[Any] = AsyncIOMotorClient(settings.mongodb_url)
+    # One client for the whole run; every concurrent seed_and_verify shares its pool
+    client: AsyncMongoClient[Any] = AsyncMongoClient(
+        settings.mongodb_url, maxPoolSize=settings.mongodb_max_pool_size
+    )
     db = client[settings.mongodb_db]
 
     try:
-        for col_info in COLLECTIONS:
-            expected_count = await seed_collection(db, col_info)
-            await verify_collection(db, col_info, expected_count)
-            print("-" * 30)
+        # Collections have no seeding dependencies on each other; overlap their round trips
+        await asyncio.gather(*(seed_and_verify(db, col_info) for col_info in COLLECTIONS))
 
         print("\n✨ Seeding and verification completed!")
 
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
     finally:
-        client.close()
+        await client.close()
 
 
 if __name__ == "__main__":
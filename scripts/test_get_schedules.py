@@ -1,16 +1,31 @@
-import json
-import urllib.error
-import urllib.request
+import asyncio
+
+import httpx
+import orjson
 
 url = "http://127.0.0.1:8000/api/v1/schedules/"
 
-try:
-    with urllib.request.urlopen(url) as response:
-        print(f"✅ GET {url} - Status: {response.getcode()}")
-        data = json.loads(response.read().decode("utf-8"))
+
+async def probe_schedules(client: httpx.AsyncClient) -> None:
+    """GET the schedules list once through a shared, keep-alive client."""
+    try:
+        response = await client.get(url)
+        if response.is_error:
+            print(f"❌ GET {url} - Status: {response.status_code}")
+            print(f"   Reason: {response.reason_phrase}")
+            return
+
+        print(f"✅ GET {url} - Status: {response.status_code}")
+        data = orjson.loads(response.content)
         print(f"   Response: {len(data)} schedules")
-except urllib.error.HTTPError as e:
-    print(f"❌ GET {url} - Status: {e.code}")
-    print(f"   Reason: {e.reason}")
-except Exception as e:
-    print(f"❌ Error: {e}")
+    except Exception as e:
+        print(f"❌ Error: {e}")
+
+
+async def main() -> None:
+    async with httpx.AsyncClient() as client:
+        await probe_schedules(client)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,68 +1,24 @@
-import json
-import urllib.error
-import urllib.request
+import asyncio
 from typing import Any
 
-BASE_URL = "http://127.0.0.1:8000/api/v1"
-
-
-def make_request(method: str, endpoint: str, data: dict[str, Any] | None = None) -> tuple[int, Any]:
-    url = f"{BASE_URL}{endpoint}"
-    headers = {"Content-Type": "application/json"}
-
-    req = urllib.request.Request(url, method=method, headers=headers)
-
-    if data:
-        json_data = json.dumps(data).encode("utf-8")
-        req.data = json_data
-
-    try:
-        with urllib.request.urlopen(req) as response:
-            status_code = response.getcode()
-            response_body = response.read().decode("utf-8")
-            try:
-                return status_code, json.loads(response_body)
-            except json.JSONDecodeError:
-                return status_code, response_body
-    except urllib.error.HTTPError as e:
-        return e.code, e.read().decode("utf-8")
-    except urllib.error.URLError as e:
-        print(f"Failed to connect to {url}: {e}")
-        return 0, str(e)
-
-
-def test_endpoint(
-    name: str, method: str, endpoint: str, data: dict[str, Any] | None = None
-) -> None:
-    print(f"Testing {name} ({method} {endpoint})...")
-    status_code, response = make_request(method, endpoint, data)
-
-    print(f"  Status: {status_code}")
-
-    if status_code in [401, 403]:
-        print("  ✅ Access Denied (Secure)")
-    elif status_code in [404, 422, 200, 201, 204, 500]:
-        print(f"  ❌ Access Allowed (Insecure) - Reached handler (Status: {status_code})")
-    else:
-        print(f"  ❓ Unexpected Status: {status_code}")
-    print("-" * 40)
+import httpx
 
+BASE_URL = "http://127.0.0.1:8000/api/v1"
 
-def main() -> None:
-    print("🔒 Verifying API Access Control (No Auth Token)\n")
+# If a request returns 404, it passed auth and tried to find the dummy ID.
+# If it returns 401/403, it stopped at auth.
+DUMMY_ID = "507f1f77bcf86cd799439011"
 
+# (name, method, endpoint, json body)
+ENDPOINT_SPECS: list[tuple[str, str, str, dict[str, Any] | None]] = [
     # 1. Schedules (Suspected Insecure)
-    # We use a dummy ID. If it returns 404, it means it passed auth and tried to find it.
-    # If it returns 401/403, it stopped at auth.
-    dummy_id = "507f1f77bcf86cd799439011"
-
-    test_endpoint(
+    (
         "Create Schedule",
         "POST",
         "/schedules/",
         {
-            "course_id": dummy_id,
-            "tutor_id": dummy_id,
+            "course_id": DUMMY_ID,
+            "tutor_id": DUMMY_ID,
             "start_date": "2025-01-01",
             "end_date": "2025-02-01",
             "days": ["Monday"],
@@ -71,21 +27,15 @@ def main() -> None:
             "capacity": 20,
             "timezone": "UTC",
         },
-    )
-
-    test_endpoint("Update Schedule", "PUT", f"/schedules/{dummy_id}", {"capacity": 30})
-
-    test_endpoint("Delete Schedule", "DELETE", f"/schedules/{dummy_id}")
-
+    ),
+    ("Update Schedule", "PUT", f"/schedules/{DUMMY_ID}", {"capacity": 30}),
+    ("Delete Schedule", "DELETE", f"/schedules/{DUMMY_ID}", None),
     # 2. Enrollments (Suspected Insecure)
-    test_endpoint("Get Enrollments by Schedule", "GET", f"/enrollments/schedule/{dummy_id}")
-
-    test_endpoint("Get Enrollment by ID", "GET", f"/enrollments/{dummy_id}")
-
-    test_endpoint("Update Enrollment", "PUT", f"/enrollments/{dummy_id}", {"status": "COMPLETED"})
-
+    ("Get Enrollments by Schedule", "GET", f"/enrollments/schedule/{DUMMY_ID}", None),
+    ("Get Enrollment by ID", "GET", f"/enrollments/{DUMMY_ID}", None),
+    ("Update Enrollment", "PUT", f"/enrollments/{DUMMY_ID}", {"status": "COMPLETED"}),
     # 3. Courses (Control - Should be Secure)
-    test_endpoint(
+    (
         "Create Course (Control)",
         "POST",
         "/courses",
@@ -101,8 +51,49 @@ def main() -> None:
                 "syllabus": [],
             },
         },
-    )
+    ),
+]
+
+
+async def make_request(
+    client: httpx.AsyncClient, method: str, endpoint: str, data: dict[str, Any] | None = None
+) -> int:
+    try:
+        response = await client.request(method, endpoint, json=data)
+    except httpx.TransportError as e:
+        print(f"Failed to connect to {BASE_URL}{endpoint}: {e}")
+        return 0
+    return response.status_code
+
+
+def report_endpoint(name: str, method: str, endpoint: str, status_code: int) -> None:
+    print(f"Testing {name} ({method} {endpoint})...")
+    print(f"  Status: {status_code}")
+
+    if status_code in [401, 403]:
+        print("  ✅ Access Denied (Secure)")
+    elif status_code in [404, 422, 200, 201, 204, 500]:
+        print(f"  ❌ Access Allowed (Insecure) - Reached handler (Status: {status_code})")
+    else:
+        print(f"  ❓ Unexpected Status: {status_code}")
+    print("-" * 40)
+
+
+async def main() -> None:
+    print("🔒 Verifying API Access Control (No Auth Token)\n")
+
+    # The checks are independent, so send them concurrently over one pooled client
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        status_codes = await asyncio.gather(
+            *(
+                make_request(client, method, endpoint, data)
+                for _, method, endpoint, data in ENDPOINT_SPECS
+            )
+        )
+
+    for (name, method, endpoint, _), status_code in zip(ENDPOINT_SPECS, status_codes, strict=True):
+        report_endpoint(name, method, endpoint, status_code)
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
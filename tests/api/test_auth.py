@@ -3,7 +3,7 @@
 import pytest
 from httpx import AsyncClient
 
-from app.core.security import hash_password
+from app.core.security import create_reset_token_expiry, hash_password
 from app.db import UserRepository, get_database
 from app.domain.users.value_objects import UserRole
 
@@ -240,3 +240,63 @@ async def test_corporate_login_successful(client: AsyncClient) -> None:
 
     payload = decode_access_token(data["access_token"])
     assert payload["role"] == UserRole.CORPORATE_STAFF
+
+
+@pytest.mark.anyio
+async def test_reissued_reset_token_invalidates_previous(client: AsyncClient) -> None:
+    """Test that issuing a new reset token leaves only the new one usable."""
+    user_repo = UserRepository(get_database())
+    await user_repo.create_password_reset_indexes()
+    expires_at = create_reset_token_expiry()
+
+    await user_repo.create_password_reset_token("user-1", "first-token", expires_at)
+    await user_repo.create_password_reset_token("user-1", "second-token", expires_at)
+
+    assert await user_repo.find_password_reset_token("first-token") is None
+    token_doc = await user_repo.find_password_reset_token("second-token")
+    assert token_doc is not None
+    assert token_doc["user_id"] == "user-1"
+
+    # The old token is rejected by the reset endpoint
+    response = await client.post(
+        "/api/v1/auth/reset-password",
+        json={"token": "first-token", "new_password": "newsecure123"},
+    )
+    assert response.status_code == 400
+
+
+@pytest.mark.anyio
+async def test_reset_token_indexes_replace_legacy_user_id_index(client: AsyncClient) -> None:
+    """Test that the unique user_id index builds over the old non-unique one."""
+    user_repo = UserRepository(get_database())
+    reset_collection = get_database()["password_reset_tokens"]
+    expires_at = create_reset_token_expiry()
+
+    # State left by the old delete_many + insert_one flow and its index
+    await reset_collection.create_index("user_id")
+    await reset_collection.insert_many(
+        [
+            {"user_id": "user-1", "token": "old-token", "expires_at": expires_at, "used": False},
+            {"user_id": "user-1", "token": "new-token", "expires_at": expires_at, "used": False},
+        ]
+    )
+
+    await user_repo.create_password_reset_indexes()
+
+    index_info = await reset_collection.index_information()
+    assert index_info["user_id_1"].get("unique") is True
+    assert await user_repo.find_password_reset_token("old-token") is None
+    assert await user_repo.find_password_reset_token("new-token") is not None
+
+
+@pytest.mark.anyio
+async def test_delete_password_reset_token(client: AsyncClient) -> None:
+    """Test that a deleted reset token can no longer be found."""
+    user_repo = UserRepository(get_database())
+    await user_repo.create_password_reset_token(
+        "user-1", "reset-token", create_reset_token_expiry()
+    )
+
+    assert await user_repo.delete_password_reset_token("reset-token") is True
+    assert await user_repo.find_password_reset_token("reset-token") is None
+    assert await user_repo.delete_password_reset_token("reset-token") is False
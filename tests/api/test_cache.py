@@ -0,0 +1,72 @@
+"""Tests for the in-process TTL cache."""
+
+import time
+
+import pytest
+
+from app.db.cache import TTLCache
+
+
+class TestTTLCache:
+    """Tests for TTLCache."""
+
+    def test_invalidate_tag_drops_every_key_of_a_document(self) -> None:
+        """Test that all keys stored with a tag are dropped together."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("id", "1"), {"_id": "1"}, tag="1")
+        cache.set(("email", "a@example.com"), {"_id": "1"}, tag="1")
+        cache.set(("id", "2"), {"_id": "2"}, tag="2")
+
+        cache.invalidate_tag("1")
+
+        assert cache.get(("id", "1")) is None
+        assert cache.get(("email", "a@example.com")) is None
+        assert cache.get(("id", "2")) == {"_id": "2"}
+
+    def test_invalidate_unknown_tag_is_a_no_op(self) -> None:
+        """Test that invalidating a tag with no entries leaves the cache intact."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set("key", "value", tag="1")
+
+        cache.invalidate_tag("2")
+
+        assert cache.get("key") == "value"
+
+    def test_evicts_least_recently_used(self) -> None:
+        """Test that the least recently used entry is evicted when full."""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1, tag="a")
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+    def test_overwriting_a_key_moves_its_tag(self) -> None:
+        """Test that re-storing a key under a new tag detaches it from the old one."""
+        cache = TTLCache(maxsize=10, ttl=60)
+        cache.set(("name", "Acme"), {"_id": "1"}, tag="1")
+        cache.set(("name", "Acme"), {"_id": "2"}, tag="2")
+
+        cache.invalidate_tag("1")
+
+        assert cache.get(("name", "Acme")) == {"_id": "2"}
+
+    def test_entries_expire(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that entries are not returned after their TTL."""
+        cache = TTLCache(maxsize=10, ttl=30)
+        cache.set("key", "value", tag="1")
+
+        later = time.monotonic() + 31
+        monkeypatch.setattr(time, "monotonic", lambda: later)
+
+        assert cache.get("key") is None
+
+    def test_zero_ttl_disables_caching(self) -> None:
+        """Test that a TTL of zero stores nothing."""
+        cache = TTLCache(maxsize=10, ttl=0)
+        cache.set("key", "value")
+
+        assert cache.get("key") is None
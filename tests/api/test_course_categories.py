@@ -195,6 +195,23 @@ class TestCreateCategory:
         response = await client.post("/api/v1/course-categories", json=payload, headers=headers)
         assert response.status_code == status.HTTP_409_CONFLICT
 
+    @pytest.mark.anyio
+    async def test_create_category_duplicate_name_different_case(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        course_category_repo: CourseCategoryRepository,
+        cleanup_categories: AsyncGenerator[None, None],
+    ) -> None:
+        """Test that category names are unique regardless of case."""
+        await course_category_repo.create_category(
+            name="Duplicate Name", description="First description"
+        )
+        payload = {"name": "duplicate name", "description": "Second description"}
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = await client.post("/api/v1/course-categories", json=payload, headers=headers)
+        assert response.status_code == status.HTTP_409_CONFLICT
+
     @pytest.mark.anyio
     async def test_create_category_name_too_short(
         self, client: AsyncClient, admin_token: str, cleanup_categories: AsyncGenerator[None, None]
@@ -550,3 +567,23 @@ class TestCourseCategoryIntegration:
         public_read = await client.get(f"/api/v1/course-categories/{category_id}")
         assert public_read.status_code == status.HTTP_200_OK
         assert public_read.json()["name"] == "Public Test"
+
+
+class TestCourseCategoryIndexes:
+    """Tests for building the case-insensitive name index."""
+
+    @pytest.mark.anyio
+    async def test_create_indexes_reports_case_variant_names(
+        self, setup_db: AsyncGenerator[None, None]
+    ) -> None:
+        """Test that names differing only by case block the index with a clear error."""
+        repo = CourseCategoryRepository(get_database())
+        await repo.collection.insert_many(
+            [
+                {"name": "Design", "description": "First"},
+                {"name": "design", "description": "Second"},
+            ]
+        )
+
+        with pytest.raises(RuntimeError, match="differ only by case"):
+            await repo.create_indexes()
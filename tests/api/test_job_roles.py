@@ -185,6 +185,21 @@ class TestCreateJobRole:
         response = await client.post("/api/v1/job-roles", json=payload, headers=headers)
         assert response.status_code == status.HTTP_409_CONFLICT
 
+    @pytest.mark.anyio
+    async def test_create_job_role_duplicate_name_different_case(
+        self,
+        client: AsyncClient,
+        admin_token: str,
+        job_role_repo: JobRoleRepository,
+        cleanup_job_roles: AsyncGenerator[None, None],
+    ) -> None:
+        """Test that job role names are unique regardless of case."""
+        await job_role_repo.create_job_role(name="Duplicate Name", description="First description")
+        payload = {"name": "duplicate name", "description": "Second description"}
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        response = await client.post("/api/v1/job-roles", json=payload, headers=headers)
+        assert response.status_code == status.HTTP_409_CONFLICT
+
     @pytest.mark.anyio
     async def test_create_job_role_name_empty(
         self, client: AsyncClient, admin_token: str, cleanup_job_roles: AsyncGenerator[None, None]
@@ -551,3 +566,23 @@ class TestJobRoleIntegration:
             "/api/v1/job-roles", json=create_payload, headers=headers_student
         )
         assert create_response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestJobRoleIndexes:
+    """Tests for building the case-insensitive name index."""
+
+    @pytest.mark.anyio
+    async def test_create_indexes_reports_case_variant_names(
+        self, setup_db: AsyncGenerator[None, None]
+    ) -> None:
+        """Test that names differing only by case block the index with a clear error."""
+        repo = JobRoleRepository(get_database())
+        await repo.collection.insert_many(
+            [
+                {"name": "Developer", "description": "First"},
+                {"name": "developer", "description": "Second"},
+            ]
+        )
+
+        with pytest.raises(RuntimeError, match="differ only by case"):
+            await repo.create_indexes()
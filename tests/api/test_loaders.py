@@ -0,0 +1,138 @@
+"""Tests for the request-scoped document loaders."""
+
+import asyncio
+from typing import Any
+
+import pytest
+from bson import ObjectId
+
+from app.db.loaders import DocumentLoader, UserLoader
+from app.db.repository import USER_LIST_PROJECTION
+
+
+class RecordingFetch:
+    """Batch fetch that serves documents from memory and records each call."""
+
+    def __init__(self, docs: list[dict[str, Any]]) -> None:
+        self.docs_by_id = {doc["_id"]: doc for doc in docs}
+        self.calls: list[list[ObjectId]] = []
+
+    async def __call__(self, ids: list[ObjectId]) -> list[dict[str, Any]]:
+        self.calls.append(ids)
+        return [self.docs_by_id[oid] for oid in ids if oid in self.docs_by_id]
+
+
+class TestDocumentLoader:
+    """Tests for DocumentLoader batching."""
+
+    @pytest.mark.anyio
+    async def test_concurrent_loads_share_one_fetch(self) -> None:
+        """Test that loads gathered together are resolved by a single fetch."""
+        docs = [{"_id": ObjectId(), "name": f"Doc {i}"} for i in range(3)]
+        fetch = RecordingFetch(docs)
+        loader = DocumentLoader(fetch)
+
+        results = await asyncio.gather(*(loader.load(str(doc["_id"])) for doc in docs))
+
+        assert results == docs
+        assert fetch.calls == [[doc["_id"] for doc in docs]]
+
+    @pytest.mark.anyio
+    async def test_duplicate_ids_are_fetched_once(self) -> None:
+        """Test that the same ID loaded twice in a batch is queried once."""
+        doc = {"_id": ObjectId(), "name": "Doc"}
+        fetch = RecordingFetch([doc])
+        loader = DocumentLoader(fetch)
+
+        results = await loader.load_many([str(doc["_id"]), str(doc["_id"])])
+
+        assert results == [doc, doc]
+        assert fetch.calls == [[doc["_id"]]]
+
+    @pytest.mark.anyio
+    async def test_missing_ids_resolve_to_none(self) -> None:
+        """Test that IDs without a document load as None, preserving order."""
+        doc = {"_id": ObjectId(), "name": "Doc"}
+        missing_id = ObjectId()
+        fetch = RecordingFetch([doc])
+        loader = DocumentLoader(fetch)
+
+        results = await loader.load_many([str(missing_id), str(doc["_id"])])
+
+        assert results == [None, doc]
+        assert fetch.calls == [[missing_id, doc["_id"]]]
+
+    @pytest.mark.anyio
+    async def test_invalid_ids_skip_the_fetch(self) -> None:
+        """Test that malformed IDs load as None without reaching the fetch."""
+        fetch = RecordingFetch([])
+        loader = DocumentLoader(fetch)
+
+        results = await loader.load_many(["not-an-object-id", ""])
+
+        assert results == [None, None]
+        assert fetch.calls == []
+
+    @pytest.mark.anyio
+    async def test_sequential_loads_start_new_batches(self) -> None:
+        """Test that loads awaited one after another are fetched separately."""
+        docs = [{"_id": ObjectId(), "name": f"Doc {i}"} for i in range(2)]
+        fetch = RecordingFetch(docs)
+        loader = DocumentLoader(fetch)
+
+        for doc in docs:
+            assert await loader.load(str(doc["_id"])) == doc
+
+        assert fetch.calls == [[docs[0]["_id"]], [docs[1]["_id"]]]
+
+    @pytest.mark.anyio
+    async def test_fetch_error_reaches_every_waiter(self) -> None:
+        """Test that a failing fetch raises in every load of the batch."""
+
+        async def failing_fetch(ids: list[ObjectId]) -> list[dict[str, Any]]:
+            raise RuntimeError("database unavailable")
+
+        loader = DocumentLoader(failing_fetch)
+
+        results = await asyncio.gather(
+            loader.load(str(ObjectId())), loader.load(str(ObjectId())), return_exceptions=True
+        )
+
+        assert [str(result) for result in results] == ["database unavailable"] * 2
+
+
+class FakeUserRepository:
+    """Stands in for UserRepository.find_by_ids and records each projection."""
+
+    def __init__(self) -> None:
+        self.projections: list[Any] = []
+
+    async def find_by_ids(
+        self, user_ids: list[ObjectId], projection: Any = USER_LIST_PROJECTION
+    ) -> list[dict[str, Any]]:
+        self.projections.append(projection)
+        return [{"_id": oid, "email": "user@example.com", "name": "User"} for oid in user_ids]
+
+
+class TestUserLoader:
+    """Tests for UserLoader projections."""
+
+    @pytest.mark.anyio
+    async def test_defaults_to_excluding_credentials(self) -> None:
+        """Test that the loader never fetches hashed_password by default."""
+        repo = FakeUserRepository()
+        loader = UserLoader(repo)  # type: ignore[arg-type]
+
+        await loader.load(str(ObjectId()))
+
+        assert repo.projections == [USER_LIST_PROJECTION]
+
+    @pytest.mark.anyio
+    async def test_passes_projection_to_batch_query(self) -> None:
+        """Test that a caller-supplied projection reaches find_by_ids."""
+        repo = FakeUserRepository()
+        loader = UserLoader(repo, projection={"email": 1, "name": 1})  # type: ignore[arg-type]
+
+        await loader.load_many([str(ObjectId()), str(ObjectId())])
+
+        assert repo.projections == [{"email": 1, "name": 1}]
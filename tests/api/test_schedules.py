@@ -136,6 +136,97 @@ class TestGetSchedules:
         assert data[0]["course_id"] == course_id
 
 
+class TestStoredScheduleDocuments:
+    """Tests for reading schedule documents not written by the current repository."""
+
+    @pytest.mark.anyio
+    async def test_get_legacy_schedule(
+        self,
+        client: AsyncClient,
+        schedule_repo: ScheduleRepository,
+        cleanup_schedules: AsyncGenerator[None, None],
+    ) -> None:
+        """Test that a document missing newer fields is read with their defaults."""
+        from bson import ObjectId
+
+        schedule_id = ObjectId()
+        now = datetime.utcnow()
+        await schedule_repo.collection.insert_one(
+            {
+                "_id": schedule_id,
+                "course_id": ObjectId(),
+                "tutor_id": "legacy_tutor_id",
+                "sessions": [
+                    {"date": "2025-01-15T18:00:00", "start_time": "18:00", "end_time": "20:00"}
+                ],
+                "capacity": 15,
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+        response = await client.get(f"/api/v1/schedules/{schedule_id}")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["tutor_id"] == "legacy_tutor_id"
+        assert data["sessions"][0]["date"] == "2025-01-15T18:00:00"
+        assert data["enrollment_count"] == 0
+        assert data["status"] == "UPCOMING"
+        assert data["timezone"] == "UTC"
+        assert data["resources"] is None
+
+    @pytest.mark.anyio
+    async def test_get_seeded_schedule(
+        self,
+        client: AsyncClient,
+        schedule_repo: ScheduleRepository,
+        admin_token: str,
+        cleanup_schedules: AsyncGenerator[None, None],
+    ) -> None:
+        """Test that a document shaped like seed/schedules.json is read and listed."""
+        from bson import ObjectId
+
+        schedule_id = ObjectId()
+        course_id = ObjectId()
+        now = datetime.utcnow()
+        await schedule_repo.collection.insert_one(
+            {
+                "_id": schedule_id,
+                "course_id": course_id,
+                "tutor_id": ObjectId(),
+                "start_date": datetime(2025, 1, 15),
+                "end_date": datetime(2025, 3, 15),
+                "days": ["Mon", "Wed", "Fri"],
+                "start_time": "18:00",
+                "end_time": "20:00",
+                "capacity": 30,
+                "enrollment_count": 1,
+                "status": "UPCOMING",
+                "meeting_url": "https://zoom.us/j/123456789",
+                "timezone": "UTC",
+                "resources": [
+                    {"title": "Course Slides", "type": "course_material", "details": "Slides"}
+                ],
+                "created_at": now,
+                "updated_at": now,
+            }
+        )
+
+        response = await client.get(f"/api/v1/schedules/{schedule_id}")
+        assert response.status_code == status.HTTP_200_OK
+        data = response.json()
+        assert data["course_id"] == str(course_id)
+        assert data["sessions"] == []
+        assert data["resources"] == [
+            {"title": "Course Slides", "type": "course_material", "details": "Slides", "url": None}
+        ]
+
+        headers = {"Authorization": f"Bearer {admin_token}"}
+        list_response = await client.get("/api/v1/schedules/", headers=headers)
+        assert list_response.status_code == status.HTTP_200_OK
+        assert [schedule["id"] for schedule in list_response.json()] == [str(schedule_id)]
+
+
 class TestUpdateSchedule:
     """Tests for PUT /schedules/{id} endpoint."""
 
@@ -7,30 +7,24 @@ from app.db import get_database
 
 
 @pytest.fixture
-async def tutor_token(client: AsyncClient) -> str:
+async def tutor_token(client: AsyncClient, tutor_password_hash: str) -> str:
     """Create a tutor user and return their JWT token."""
-    from app.core.security import hash_password
+    from app.core.security import create_access_token
     from app.db import UserRepository
     from app.domain.users.value_objects import UserRole
 
     db = get_database()
     user_repo = UserRepository(db)
 
-    await user_repo.create_user(
+    user_doc = await user_repo.create_user(
         email="tutor_sub@example.com",
         name="Tutor User",
-        hashed_password=hash_password("tutorpass123"),
+        hashed_password=tutor_password_hash,
         role=UserRole.TUTOR,
     )
 
-    response = await client.post(
-        "/api/v1/auth/login",
-        json={
-            "email": "tutor_sub@example.com",
-            "password": "tutorpass123",
-        },
-    )
-    return str(response.json()["access_token"])
+    # Mint the token directly; login would only add an argon2 verify and a round trip
+    return create_access_token(data={"sub": str(user_doc["_id"]), "role": UserRole.TUTOR})
 
 
 @pytest.fixture
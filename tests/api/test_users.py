@@ -169,3 +169,74 @@ async def test_created_tutor_can_login(client: AsyncClient, admin_token: str) ->
     assert data["email"] == "logintutor@example.com"
     assert data["role"] == "tutor"
     assert "access_token" in data
+
+
+async def _create_cached_user(client: AsyncClient) -> tuple[str, str]:
+    """Create a student, warm the user cache by ID and email, and return both keys."""
+    from app.core.security import hash_password
+    from app.db import UserRepository, get_database
+    from app.domain.users.value_objects import UserRole
+
+    user_repo = UserRepository(get_database())
+    user_doc = await user_repo.create_user(
+        email="cached@example.com",
+        name="Cached User",
+        hashed_password=hash_password("cachedpass123"),
+        role=UserRole.STUDENT,
+    )
+    user_id = str(user_doc["_id"])
+    assert await user_repo.find_by_id(user_id) is not None
+    assert await user_repo.find_by_email("Cached@Example.com") is not None
+    return user_id, "Cached@Example.com"
+
+
+@pytest.mark.anyio
+async def test_user_cache_reflects_role_change(client: AsyncClient) -> None:
+    """Test that cached lookups by ID and email see a role change immediately."""
+    from app.db import UserRepository, get_database
+    from app.domain.users.value_objects import UserRole
+
+    user_id, email = await _create_cached_user(client)
+    user_repo = UserRepository(get_database())
+
+    assert await user_repo.update_user_role(user_id, UserRole.TUTOR) is True
+
+    by_id = await user_repo.find_by_id(user_id)
+    by_email = await user_repo.find_by_email(email)
+    assert by_id is not None and by_id["role"] == UserRole.TUTOR
+    assert by_email is not None and by_email["role"] == UserRole.TUTOR
+
+
+@pytest.mark.anyio
+async def test_user_cache_reflects_update(client: AsyncClient) -> None:
+    """Test that cached lookups see status and name updates immediately."""
+    from app.db import UserRepository, get_database
+
+    user_id, email = await _create_cached_user(client)
+    user_repo = UserRepository(get_database())
+
+    assert await user_repo.update_user_status(user_id, False) is True
+    assert await user_repo.update_name(user_id, "Renamed User") is True
+
+    by_id = await user_repo.find_by_id(user_id)
+    by_email = await user_repo.find_by_email(email)
+    assert by_id is not None
+    assert by_id["is_active"] is False
+    assert by_id["name"] == "Renamed User"
+    assert by_email is not None
+    assert by_email["is_active"] is False
+    assert by_email["name"] == "Renamed User"
+
+
+@pytest.mark.anyio
+async def test_user_cache_reflects_delete(client: AsyncClient) -> None:
+    """Test that a deleted user is no longer served from the cache."""
+    from app.db import UserRepository, get_database
+
+    user_id, email = await _create_cached_user(client)
+    user_repo = UserRepository(get_database())
+
+    assert await user_repo.delete_user(user_id) is True
+
+    assert await user_repo.find_by_id(user_id) is None
+    assert await user_repo.find_by_email(email) is None
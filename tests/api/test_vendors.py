@@ -94,6 +94,29 @@ class TestGetAllVendors:
         assert response.status_code == status.HTTP_200_OK
         assert len(response.json()) == 10
 
+    @pytest.mark.anyio
+    async def test_get_all_vendors_paginated(
+        self,
+        client: AsyncClient,
+        vendor_repo: VendorRepository,
+        cleanup_vendors: AsyncGenerator[None, None],
+    ) -> None:
+        """Test paging through vendors with limit and after_id."""
+        for i in range(5):
+            await vendor_repo.create_vendor(name=f"Vendor {i}", description=f"Description {i}")
+        response = await client.get("/api/v1/vendors", params={"limit": 3})
+        assert response.status_code == status.HTTP_200_OK
+        first_page = response.json()
+        assert len(first_page) == 3
+
+        response = await client.get(
+            "/api/v1/vendors", params={"limit": 3, "after_id": first_page[-1]["id"]}
+        )
+        assert response.status_code == status.HTTP_200_OK
+        second_page = response.json()
+        assert len(second_page) == 2
+        assert {v["id"] for v in first_page}.isdisjoint(v["id"] for v in second_page)
+
 
 class TestGetSingleVendor:
     """Tests for GET /vendors/{id} endpoint."""
@@ -595,3 +618,67 @@ class TestVendorIntegration:
             "/api/v1/vendors", json=create_payload, headers=headers_student
         )
         assert create_response.status_code == status.HTTP_403_FORBIDDEN
+
+
+class TestVendorNameUniqueIndex:
+    """Duplicate names are rejected by the unique name index, not a pre-check."""
+
+    @pytest.mark.anyio
+    async def test_create_duplicate_rejected_by_index(self, vendor_repo: VendorRepository) -> None:
+        """Test that the index turns a duplicate insert into ValueError."""
+        await vendor_repo.create_vendor(name="Duplicate Name", description="First description")
+
+        with pytest.raises(ValueError):
+            await vendor_repo.create_vendor(name="Duplicate Name", description="Second description")
+        assert await vendor_repo.collection.count_documents({"name": "Duplicate Name"}) == 1
+
+    @pytest.mark.anyio
+    async def test_update_to_duplicate_rejected_by_index(
+        self, vendor_repo: VendorRepository
+    ) -> None:
+        """Test that the index turns a rename to a taken name into ValueError."""
+        await vendor_repo.create_vendor(name="Vendor 1", description="Description 1")
+        vendor2 = await vendor_repo.create_vendor(name="Vendor 2", description="Description 2")
+
+        with pytest.raises(ValueError):
+            await vendor_repo.update_vendor(str(vendor2["_id"]), name="Vendor 1")
+        assert await vendor_repo.collection.count_documents({"name": "Vendor 1"}) == 1
+        unchanged = await vendor_repo.collection.find_one({"_id": vendor2["_id"]})
+        assert unchanged is not None
+        assert unchanged["name"] == "Vendor 2"
+
+
+class TestVendorCache:
+    """Cached vendor lookups never serve a document older than the last write."""
+
+    @pytest.mark.anyio
+    async def test_cache_reflects_update(self, vendor_repo: VendorRepository) -> None:
+        """Test that lookups by ID and name see a rename immediately."""
+        vendor = await vendor_repo.create_vendor(name="Old Name", description="Description")
+        vendor_id = str(vendor["_id"])
+        assert await vendor_repo.find_by_id(vendor_id) is not None
+        assert await vendor_repo.find_by_name("Old Name") is not None
+
+        await vendor_repo.update_vendor(vendor_id, name="New Name", description="Updated")
+
+        by_id = await vendor_repo.find_by_id(vendor_id)
+        assert by_id is not None
+        assert by_id["name"] == "New Name"
+        assert by_id["description"] == "Updated"
+        assert await vendor_repo.find_by_name("Old Name") is None
+        by_name = await vendor_repo.find_by_name("New Name")
+        assert by_name is not None
+        assert str(by_name["_id"]) == vendor_id
+
+    @pytest.mark.anyio
+    async def test_cache_reflects_delete(self, vendor_repo: VendorRepository) -> None:
+        """Test that a deleted vendor is no longer served from the cache."""
+        vendor = await vendor_repo.create_vendor(name="Doomed", description="Description")
+        vendor_id = str(vendor["_id"])
+        assert await vendor_repo.find_by_id(vendor_id) is not None
+        assert await vendor_repo.find_by_name("Doomed") is not None
+
+        assert await vendor_repo.delete_vendor(vendor_id) is True
+
+        assert await vendor_repo.find_by_id(vendor_id) is None
+        assert await vendor_repo.find_by_name("Doomed") is None
@@ -1,12 +1,23 @@
 """Pytest configuration and fixtures for all tests."""
 
+import os
 from collections.abc import AsyncGenerator
 from typing import Any
 
 import pytest
+from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 
+# Cheap argon2 parameters for tests; must be set before app settings are loaded
+os.environ.setdefault("ARGON2_TIME_COST", "1")
+os.environ.setdefault("ARGON2_MEMORY_COST", "1024")
+# Tests run in one process, so exercise the user cache and its invalidation
+os.environ.setdefault("USER_CACHE_TTL_SECONDS", "30")
+
+from app.core.security import hash_password
 from app.db import close_mongodb_connection, connect_to_mongodb, get_database
+from app.db.repository import user_cache
+from app.db.vendor_repository import vendor_cache
 from app.main import create_app
 
 
@@ -16,6 +27,12 @@ def anyio_backend():
     return "asyncio"
 
 
+@pytest.fixture(scope="session")
+def tutor_password_hash() -> str:
+    """Hash the tutor test password once per session."""
+    return hash_password("tutorpass123")
+
+
 @pytest.fixture
 async def setup_db() -> AsyncGenerator[None, None]:
     """Setup and teardown MongoDB for tests."""
@@ -23,6 +40,8 @@ async def setup_db() -> AsyncGenerator[None, None]:
     # Ensure clean slate
     db = get_database()  # type: ignore[assignment]
     await db.client.drop_database(db.name)  # type: ignore[attr-defined]
+    user_cache.clear()
+    vendor_cache.clear()
 
     yield
 
@@ -31,12 +50,17 @@ async def setup_db() -> AsyncGenerator[None, None]:
     await close_mongodb_connection()
 
 
+@pytest.fixture(scope="session")
+def app() -> FastAPI:
+    """Build the app once per session; wiring every router takes ~0.2s."""
+    return create_app()
+
+
 @pytest.fixture
 async def client(
-    setup_db: AsyncGenerator[None, None]
+    app: FastAPI, setup_db: AsyncGenerator[None, None]
 ) -> AsyncGenerator[AsyncClient, None]:  # noqa: ARG001
     """Provide an async HTTP client for testing."""
-    app = create_app()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as client:
         yield client